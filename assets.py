@@ -0,0 +1,468 @@
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import threading
+import pygame
+from collections import OrderedDict
+from config import ASSET_CACHE_BUDGET, RAW_CACHE_DIR, SPRITE_PACK_DIR, WIDTH, HEIGHT
+
+
+# ==================== CACHÉ DE SUPERFICIES ====================
+class SurfaceCache:
+    """
+    Caché global de imágenes ya decodificadas, escaladas y convertidas.
+    Cada imagen se carga una sola vez por proceso; las siguientes
+    peticiones devuelven la MISMA superficie (no modificarla).
+
+    La clave es (ruta, tamaño destino, modo de conversión, volteo) y el caché
+    respeta un presupuesto de bytes: al superarlo descarta las imágenes
+    usadas hace más tiempo (LRU).
+
+    Con disk (un RawImageCache), lo que falta en memoria se busca primero
+    en disco ya decodificado y escalado; solo si no está se decodifica.
+    """
+
+    def __init__(self, budget_bytes, disk=None):
+        self.budget_bytes = budget_bytes
+        self.disk = disk  # RawImageCache o None
+        self.entries = OrderedDict()  # clave -> superficie
+        self.bytes = 0  # Bytes ocupados actualmente
+
+        # Contadores
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(path, size=None, mode="alpha", flip=False):
+        """Clave del caché para una imagen"""
+        return (path, tuple(size) if size else None, mode, flip)
+
+    @staticmethod
+    def surface_bytes(surface):
+        """Memoria aproximada que ocupa una superficie"""
+        return surface.get_pitch() * surface.get_height()
+
+    def get(self, key):
+        """Devuelve la superficie guardada (o None) y la marca como reciente"""
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+        return surface
+
+    def put(self, key, surface):
+        """Guarda una superficie y descarta las más antiguas si hace falta"""
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.bytes -= self.surface_bytes(old)
+
+        self.entries[key] = surface
+        self.bytes += self.surface_bytes(surface)
+
+        # Nunca se descarta la superficie recién guardada
+        while self.bytes > self.budget_bytes and len(self.entries) > 1:
+            _, evicted = self.entries.popitem(last=False)
+            self.bytes -= self.surface_bytes(evicted)
+            self.evictions += 1
+
+    def load_image(self, path, size=None, mode="alpha", flip=False):
+        """
+        Carga una imagen pasando por el caché.
+
+        Args:
+            path: Ruta de la imagen
+            size: Tamaño destino (ancho, alto) o None para dejarla igual
+            mode: "alpha" (convert_alpha), "opaque" (convert) o "raw"
+            flip: Si True, devuelve la imagen espejada horizontalmente
+
+        Lanza las mismas excepciones que pygame.image.load si la imagen
+        no existe, así que los try/except existentes siguen funcionando.
+        """
+        key = self.key(path, size, mode, flip)
+        surface = self.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+
+        if flip:
+            # La versión espejada se calcula a partir de la normal
+            surface = pygame.transform.flip(
+                self.load_image(path, size, mode), True, False
+            )
+            self.misses += 1
+            self.put(key, surface)
+            return surface
+
+        self.misses += 1
+        surface = self.convert(self.decode(path, size), mode)
+
+        self.put(key, surface)
+        return surface
+
+    def decode(self, path, size=None):
+        """
+        Imagen escalada y SIN convertir: del caché en disco si está al día,
+        si no decodificada (y guardada en disco para el próximo arranque).
+        No toca la pantalla, así que se puede llamar desde otro hilo.
+        """
+        surface = self.disk.load(path, size) if self.disk else None
+        if surface is None:
+            surface = pygame.image.load(path)
+            if size:
+                surface = pygame.transform.scale(surface, size)
+            if self.disk:
+                self.disk.store(path, size, surface)
+        return surface
+
+    @staticmethod
+    def convert(surface, mode):
+        """
+        Convierte la superficie al formato de pantalla según el modo.
+        Sin ventana (simulación headless sin set_mode) se deja tal cual.
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        if mode == "alpha":
+            return surface.convert_alpha()
+        if mode == "opaque":
+            return surface.convert()
+        return surface
+
+    def discard(self, match):
+        """Descarta las entradas cuya clave cumple match(clave)"""
+        for key in [key for key in self.entries if match(key)]:
+            self.bytes -= self.surface_bytes(self.entries.pop(key))
+
+    def clear(self):
+        """Vacía el caché (los contadores se mantienen)"""
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        """Devuelve los contadores del caché"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "budget_bytes": self.budget_bytes,
+            "disk_hits": self.disk.hits if self.disk else 0,
+            "disk_writes": self.disk.writes if self.disk else 0,
+        }
+
+
+# ==================== CACHÉ EN DISCO (PÍXELES CRUDOS) ====================
+class RawImageCache:
+    """
+    Copia en disco de las imágenes ya decodificadas y escaladas, como
+    píxeles crudos RGB/RGBA. En el siguiente arranque el archivo se mapea
+    a memoria (mmap) y pygame.image.frombuffer arma la superficie sin
+    descomprimir el PNG/JPG: el sistema operativo solo lee las páginas.
+
+    manifest.json guarda por entrada la imagen original, su mtime y tamaño
+    en bytes y el tamaño al que se escaló; si la original cambia, la
+    entrada se ignora y se vuelve a generar.
+
+    Las imágenes con paleta o colorkey no se guardan (en crudo perderían
+    la transparencia) y siguen el camino normal. Si no se puede escribir
+    en el directorio, simplemente no hay caché.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.manifest = None  # clave -> entrada (se lee la primera vez)
+        self.lock = threading.Lock()  # La precarga lo usa desde otro hilo
+
+        # Contadores
+        self.hits = 0
+        self.writes = 0
+
+    @staticmethod
+    def entry_key(path, size):
+        if size:
+            return f"{path}|{size[0]}x{size[1]}"
+        return f"{path}|original"
+
+    def load_manifest(self):
+        if self.manifest is None:
+            try:
+                path = os.path.join(self.directory, "manifest.json")
+                with open(path, encoding="utf-8") as f:
+                    self.manifest = json.load(f)["entries"]
+            except (OSError, ValueError, KeyError):
+                self.manifest = {}
+        return self.manifest
+
+    def load(self, path, size=None):
+        """Superficie guardada para (path, size), o None si no hay o quedó vieja"""
+        with self.lock:
+            entry = self.load_manifest().get(self.entry_key(path, size))
+        if entry is None:
+            return None
+
+        try:
+            if file_stamp(path) != entry["stamp"]:
+                return None
+            with open(os.path.join(self.directory, entry["file"]), "rb") as f:
+                # ACCESS_COPY: copia privada bajo demanda. Con ACCESS_READ,
+                # dibujar sobre la superficie ("raw" o sin ventana, donde
+                # convert no copia) escribiría en memoria de solo lectura
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+            # La superficie usa el mapeo directamente (no copia los píxeles
+            # hasta que alguien los modifica)
+            surface = pygame.image.frombuffer(
+                data, tuple(entry["size"]), entry["format"]
+            )
+        except (OSError, ValueError, pygame.error):
+            return None
+
+        self.hits += 1
+        return surface
+
+    def store(self, path, size, surface):
+        """Guarda los píxeles de una imagen recién decodificada y escalada"""
+        if surface.get_colorkey() is not None or surface.get_bitsize() < 24:
+            return
+
+        fmt = "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGB"
+        key = self.entry_key(path, size)
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()[:20] + ".raw"
+        try:
+            stamp = file_stamp(path)
+            os.makedirs(self.directory, exist_ok=True)
+            self.write_file(name, pygame.image.tobytes(surface, fmt))
+
+            with self.lock:
+                self.load_manifest()[key] = {
+                    "file": name,
+                    "source": path,
+                    "stamp": stamp,
+                    "scale": list(size) if size else None,
+                    "size": list(surface.get_size()),
+                    "format": fmt,
+                }
+                manifest = {"version": 1, "entries": self.manifest}
+                self.write_file(
+                    "manifest.json", json.dumps(manifest, indent=1).encode("utf-8")
+                )
+        except OSError:
+            return
+        self.writes += 1
+
+    def write_file(self, name, data):
+        """
+        Escribe en un temporal y lo reemplaza: un archivo que otra superficie
+        tiene mapeado nunca se trunca debajo de ella.
+        """
+        path = os.path.join(self.directory, name)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def clear(self):
+        """Borra todo el caché en disco"""
+        with self.lock:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            self.manifest = {}
+
+
+# Instancia global del caché de imágenes (con caché en disco si está activo)
+ASSETS = SurfaceCache(
+    ASSET_CACHE_BUDGET, RawImageCache(RAW_CACHE_DIR) if RAW_CACHE_DIR else None
+)
+
+
+def load_image(path, size=None, mode="alpha", flip=False):
+    """Atajo para ASSETS.load_image"""
+    return ASSETS.load_image(path, size, mode, flip)
+
+
+# ==================== FONDOS COMPUESTOS ====================
+def composite(key, build):
+    """
+    Superficie opaca de pantalla completa compuesta una sola vez.
+    build() la dibuja la primera vez (o después de invalidate_composites)
+    y queda en ASSETS ya convertida al formato de la pantalla.
+    """
+    key = ("composite",) + tuple(key)
+    surface = ASSETS.get(key)
+    if surface is None:
+        surface = ASSETS.convert(build(), "opaque")
+        ASSETS.put(key, surface)
+    return surface
+
+
+def composite_background(path, tint, fill=(0, 0, 0)):
+    """
+    Fondo + oscurecido en UNA superficie opaca: dibujarlo es un solo blit,
+    sin crear ni mezclar un overlay de pantalla completa en cada frame.
+
+    Args:
+        path: Imagen de fondo (None = solo color)
+        tint: Color (r, g, b, a) del overlay, o None para no oscurecer
+        fill: Color de fondo si la imagen no se puede cargar
+    """
+
+    def build():
+        surface = pygame.Surface((WIDTH, HEIGHT))
+        try:
+            surface.blit(ASSETS.load_image(path, (WIDTH, HEIGHT), "opaque"), (0, 0))
+        except:
+            surface.fill(fill)
+
+        if tint:
+            overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+            overlay.fill(tint)
+            surface.blit(overlay, (0, 0))
+        return surface
+
+    return composite(("background", path, tuple(tint or ()), tuple(fill)), build)
+
+
+def invalidate_composites():
+    """
+    Descarta los fondos compuestos; se vuelven a componer al dibujarlos.
+    Llamar al cambiar el modo de video (el formato de pantalla cambia).
+    """
+    ASSETS.discard(lambda key: key[0] == "composite")
+
+
+# ==================== ANIMACIONES CON ORIENTACIÓN ====================
+class FrameSet:
+    """
+    Frames de una animación con las dos orientaciones ya calculadas.
+    En draw() basta con frames.get(i, flip): nunca se llama a
+    pygame.transform.flip por entidad y por frame.
+    """
+
+    def __init__(self, frames, flipped):
+        self.frames = frames  # Orientación original del dibujo
+        self.flipped = flipped  # Espejadas horizontalmente
+
+    def get(self, index, flip=False):
+        """Devuelve el frame pedido en la orientación pedida"""
+        return self.flipped[index] if flip else self.frames[index]
+
+    def __getitem__(self, index):
+        return self.frames[index]
+
+    def __len__(self):
+        return len(self.frames)
+
+
+def frame_paths(folder, count):
+    """Rutas folder/frame1.png ... folder/frame{count}.png"""
+    return [f"{folder}/frame{i}.png" for i in range(1, count + 1)]
+
+
+# ==================== HOJAS DE SPRITES EMPAQUETADAS ====================
+# spritepack.py guarda cada animación ya escalada como una tira horizontal
+# (una hoja por animación y tamaño) y un índice JSON en SPRITE_PACK_DIR.
+# Si hay una hoja al día, load_frames hace UNA decodificación (sin escalar)
+# y recorta los frames como subsuperficies; si no, carga los sueltos.
+_PACK_INDEX = None  # clave -> entrada de index.json (se lee una sola vez)
+
+
+def pack_key(folder, count, size):
+    """Clave de una animación en el índice de hojas"""
+    return f"{folder}|{count}|{size[0]}x{size[1]}"
+
+
+def file_stamp(path):
+    """(mtime, tamaño) de un archivo, para saber si cambió"""
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def pack_index(reload=False):
+    """Índice de hojas empaquetadas ({} si todavía no se generó)"""
+    global _PACK_INDEX
+    if _PACK_INDEX is None or reload:
+        try:
+            path = os.path.join(SPRITE_PACK_DIR, "index.json")
+            with open(path, encoding="utf-8") as f:
+                _PACK_INDEX = json.load(f)["sheets"]
+        except (OSError, ValueError, KeyError):
+            _PACK_INDEX = {}
+    return _PACK_INDEX
+
+
+def packed_sheet(folder, count, size):
+    """
+    Entrada del índice para la animación, o None si no hay hoja o quedó
+    vieja (algún frame cambió, se borró o apareció después de empaquetar).
+    """
+    entry = pack_index().get(pack_key(folder, count, size))
+    if entry is None:
+        return None
+
+    sources = entry["sources"]
+    for path in frame_paths(folder, count):
+        try:
+            stamp = file_stamp(path)
+        except OSError:
+            stamp = None
+        if stamp != sources.get(path):
+            return None
+    return entry
+
+
+def sheet_path(entry):
+    return os.path.join(SPRITE_PACK_DIR, entry["sheet"])
+
+
+def load_sheet_frames(entry, mode="alpha"):
+    """
+    Frames de una hoja empaquetada como subsuperficies (no copian píxeles).
+    La hoja espejada tiene los frames en orden inverso.
+    """
+    path = sheet_path(entry)
+    sheet = ASSETS.load_image(path, None, mode)
+    mirrored = ASSETS.load_image(path, None, mode, flip=True)
+
+    w, h = entry["size"]
+    count = len(entry["frames"])
+    frames = [sheet.subsurface((i * w, 0, w, h)) for i in range(count)]
+    flipped = [
+        mirrored.subsurface(((count - 1 - i) * w, 0, w, h)) for i in range(count)
+    ]
+    return FrameSet(frames, flipped)
+
+
+def frame_images(folder, count, size, mode="alpha"):
+    """
+    Imágenes que load_frames va a pedir a ASSETS, como (ruta, tamaño, modo):
+    la hoja si hay una al día, si no cada frame suelto. Sirve para precargar.
+    """
+    entry = packed_sheet(folder, count, size)
+    if entry is not None:
+        return [(sheet_path(entry), None, mode)]
+    return [(path, tuple(size), mode) for path in frame_paths(folder, count)]
+
+
+def load_frames(folder, count, size, mode="alpha"):
+    """
+    Carga folder/frame1.png ... folder/frame{count}.png con ambas
+    orientaciones. Los frames que no existen se omiten.
+    Si spritepack.py dejó una hoja al día para ese tamaño, se usa esa.
+    """
+    entry = packed_sheet(folder, count, size)
+    if entry is not None:
+        try:
+            return load_sheet_frames(entry, mode)
+        except:
+            pass  # Hoja borrada o dañada: se cargan los frames sueltos
+
+    frames = []
+    flipped = []
+    for path in frame_paths(folder, count):
+        try:
+            frames.append(ASSETS.load_image(path, size, mode))
+            flipped.append(ASSETS.load_image(path, size, mode, flip=True))
+        except:
+            pass
+    return FrameSet(frames, flipped)
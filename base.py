@@ -2,11 +2,56 @@ import pygame
 
 
 class ScreenBase:
+    # True si algo cambió y hay que volver a dibujar (ver wants_idle)
+    dirty = True
+    # Zonas que cambiaron desde el último dibujo; None = toda la pantalla
+    dirty_area = None
+
     def handle_event(self, event):
         pass
 
-    def update(self, dt): 
+    def update(self, dt):
+        pass
+
+    def draw(self, surf, alpha=1.0):
+        pass
+
+    # ==================== REDIBUJADO ====================
+    # Una pantalla quieta (menús) puede devolver True en wants_idle():
+    # el loop deja de dibujarla a 60 FPS, espera eventos y solo la dibuja
+    # cuando queda marcada como sucia (input, hover o un tick de animación).
+    # Si solo cambió una zona (un botón, el cursor) se redibuja y se
+    # actualiza en la ventana solo esa zona
+
+    def wants_idle(self):
+        """True si la pantalla solo cambia cuando se la marca con mark_dirty()"""
+        return False
+
+    def mark_dirty(self, rect=None):
+        """Marca para redibujar la zona rect, o toda la pantalla si es None"""
+        if rect is None:
+            self.dirty_area = None
+        elif not self.dirty:
+            self.dirty_area = [pygame.Rect(rect)]
+        elif self.dirty_area is not None:
+            self.dirty_area.append(pygame.Rect(rect))
+        self.dirty = True
+
+    def screen_name(self):
+        """Nombre con el que el perfilador agrupa los tiempos de la pantalla"""
+        return type(self).__name__
+
+    # ==================== CICLO DE VIDA ====================
+    # El ScreenManager llama a estos métodos; por defecto no hacen nada
+
+    def on_enter(self):
+        """La pantalla pasa a ser la activa (push, replace o al volver a ella)"""
+        pass
+
+    def on_exit(self):
+        """La pantalla deja de ser la activa (otra encima o sale de la pila)"""
         pass
 
-    def draw(self, surf):
+    def unload(self):
+        """La pantalla sale de la pila para siempre: liberar superficies, etc."""
         pass
@@ -0,0 +1,525 @@
+"""
+Benchmark headless del juego.
+
+Arranca el juego sin ventana, recorre todas las pantallas durante N frames
+con entrada guionada y mide por separado update() y draw() de cada frame,
+y en una pasada con tracemalloc cuántos bloques de memoria asigna cada uno.
+También mide las funciones de dibujo más usadas (draw_text, draw_text_fast,
+draw_hud, HudLayer.draw, draw_intro_overlay, Button.draw, PowerUp.draw) y
+compara el tiempo de CPU por frame de los menús con redibujo completo + flip
+y con zonas sucias. Por último mide, en procesos nuevos, el tiempo hasta el
+primer frame de un nivel sin caché en disco, con el caché vacío y con el
+caché ya escrito.
+
+Uso:
+    python benchmark.py                          # guarda benchmark.json
+    python benchmark.py --frames 300 --out base.json
+    python benchmark.py --compare base.json      # compara contra una base
+
+Con --compare el proceso termina con código 1 si alguna métrica empeoró
+más que --threshold por ciento.
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pygame
+from config import bootstrap, WIDTH, HEIGHT, PLAYER_MAX_HP, TICK_RATE
+from config import draw_text, draw_text_fast, draw_hud, draw_intro_overlay
+from assets import ASSETS, RawImageCache
+from game_state import GAME
+from player import Player
+from main import ScreenManager
+from pages import Button, CoverScreen, CustomizeScreen, SurvivalTipsScreen
+from pages import IntroScreen
+from powerup import PowerUp
+from hud import HudLayer
+from level import LevelScreen, VictoryScreen, load_level_spec
+
+STEP = 1.0 / TICK_RATE
+
+
+# ==================== ENTRADA GUIONADA ====================
+def key_event(key, unicode=""):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=0)
+
+
+def menu_script(frame):
+    """Menús: el mouse entra y sale de los botones (hover) sin hacer click"""
+    pos = (WIDTH // 2, HEIGHT // 2 + 165) if frame % 60 < 30 else (10, 10)
+    return [pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=())]
+
+
+def customize_script(frame):
+    """Pantalla de nombre: escribe y borra letras"""
+    if frame % 20 == 0:
+        return [key_event(pygame.K_a, "a")]
+    if frame % 20 == 10:
+        return [key_event(pygame.K_BACKSPACE)]
+    return []
+
+
+def level_script(frame):
+    """Niveles: ataca cada 10 frames; el jugador no muere para no cortar la pelea"""
+    GAME.player.health = PLAYER_MAX_HP
+    return [key_event(pygame.K_SPACE, " ")] if frame % 10 == 0 else []
+
+
+def idle_script(frame):
+    return []
+
+
+def level_factory(level_id, horde=None):
+    def build(manager):
+        screen = LevelScreen(manager, level_id)
+        screen.countdown = 0  # Saltar la intro: se mide el combate
+        if horde:
+            # Modo horda: cientos de enemigos comunes del mismo nivel
+            screen.enemies = screen.spawn_enemies(horde)
+        return screen
+
+    return build
+
+
+# (nombre, constructor, guion de entrada)
+SCENARIOS = [
+    ("CoverScreen", CoverScreen, menu_script),
+    ("CustomizeScreen", CustomizeScreen, customize_script),
+    ("SurvivalTipsScreen", SurvivalTipsScreen, menu_script),
+    ("IntroScreen", IntroScreen, menu_script),
+    ("LevelScreen:level1", level_factory("level1"), level_script),
+    ("LevelScreen:level2", level_factory("level2"), level_script),
+    ("LevelScreen:level3", level_factory("level3"), level_script),
+    ("LevelScreen:level4", level_factory("level4"), level_script),
+    ("LevelScreen:horde", level_factory("level2", horde=300), level_script),
+    ("VictoryScreen", VictoryScreen, idle_script),
+]
+
+
+# ==================== MEDICIONES ====================
+def summarize(values):
+    """Media y percentiles de una lista de valores (tiempos, bloques)"""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    return {
+        "mean": sum(ordered) / len(ordered),
+        "p50": ordered[round(last * 0.50)],
+        "p95": ordered[round(last * 0.95)],
+        "p99": ordered[round(last * 0.99)],
+        "max": ordered[-1],
+    }
+
+
+def reset_game():
+    """Estado inicial de una partida antes de cada escenario"""
+    random.seed(1)  # Mismos spawns en cada corrida
+    GAME.player = Player(100, 300)
+    GAME.score = 0
+    GAME.nickname = "Jugador"
+
+
+# Lo que asignan tracemalloc y el propio benchmark no cuenta
+ALLOC_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+]
+
+
+def allocated_blocks(before, after):
+    """
+    Bloques de memoria asignados entre dos snapshots de tracemalloc que
+    siguen vivos en el segundo (suma de los aumentos por línea de código).
+    Los temporales que se liberan antes del segundo snapshot no aparecen:
+    esos se ven en el pico de memoria.
+    """
+    diff = after.filter_traces(ALLOC_FILTERS).compare_to(
+        before.filter_traces(ALLOC_FILTERS), "lineno"
+    )
+    return sum(stat.count_diff for stat in diff if stat.count_diff > 0)
+
+
+def run_screen(surf, factory, script, frames, trace=False):
+    """
+    Corre una pantalla durante `frames` frames.
+    Devuelve los tiempos de update y draw de cada frame (ms) y, con
+    trace=True, por cada frame la cantidad de bloques asignados (ver
+    allocated_blocks) y el pico de memoria de Python asignada (KB).
+    """
+    reset_game()
+    manager = ScreenManager()
+    manager.push(factory(manager))
+
+    update_ms, draw_ms, alloc_blocks, alloc_kb = [], [], [], []
+    for frame in range(frames):
+        if trace:
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+
+        t0 = time.perf_counter()
+        for event in script(frame):
+            manager.handle_event(event)
+        manager.update(STEP)
+        t1 = time.perf_counter()
+        manager.draw(surf)
+        t2 = time.perf_counter()
+
+        update_ms.append((t1 - t0) * 1000.0)
+        draw_ms.append((t2 - t1) * 1000.0)
+        if trace:
+            _, peak = tracemalloc.get_traced_memory()
+            alloc_kb.append((peak - base) / 1024.0)
+            alloc_blocks.append(allocated_blocks(before, tracemalloc.take_snapshot()))
+
+    # Sacar todo de la pila para que cada pantalla libere sus recursos
+    while manager.screens:
+        manager.pop()
+    return update_ms, draw_ms, alloc_blocks, alloc_kb
+
+
+def bench_screens(surf, frames, alloc_frames):
+    results = {}
+    for name, factory, script in SCENARIOS:
+        # Tiempos sin tracemalloc (lo hace varias veces más lento)
+        update_ms, draw_ms, _, _ = run_screen(surf, factory, script, frames)
+
+        tracemalloc.start()
+        _, _, alloc_blocks, alloc_kb = run_screen(
+            surf, factory, script, alloc_frames, trace=True
+        )
+        tracemalloc.stop()
+
+        results[name] = {
+            "update_ms": summarize(update_ms),
+            "draw_ms": summarize(draw_ms),
+            "alloc_blocks": summarize(alloc_blocks),
+            "alloc_peak_kb": summarize(alloc_kb),
+            "frames": {
+                "update_ms": update_ms,
+                "draw_ms": draw_ms,
+                "alloc_blocks": alloc_blocks,
+                "alloc_peak_kb": alloc_kb,
+            },
+        }
+        print(
+            f"{name:<22} update p50 {results[name]['update_ms']['p50']:7.3f} ms"
+            f"   draw p50 {results[name]['draw_ms']['p50']:7.3f} ms"
+            f"   bloques p50 {results[name]['alloc_blocks']['p50']:5d}",
+            file=sys.stderr,
+        )
+    return results
+
+
+# (nombre, constructor, botón cuyo hover se alterna)
+PRESENT_SCENARIOS = [
+    ("CoverScreen", CoverScreen, "start_btn"),
+    ("CustomizeScreen", CustomizeScreen, "next_btn"),
+    ("SurvivalTipsScreen", SurvivalTipsScreen, "next_btn"),
+    ("IntroScreen", IntroScreen, "cont_btn"),
+]
+
+
+def bench_present(surf, frames):
+    """
+    Tiempo de CPU por frame de dibujar + presentar un menú donde solo cambia
+    el hover de un botón: redibujo completo + flip contra zonas sucias +
+    display.update(rects)
+    """
+    results = {}
+    for name, factory, button_name in PRESENT_SCENARIOS:
+        results[name] = {}
+        for mode, partial in (("full_ms", False), ("dirty_ms", True)):
+            reset_game()
+            manager = ScreenManager()
+            screen = factory(manager)
+            manager.push(screen)
+            while not screen.wants_idle():
+                manager.update(STEP)
+            manager.draw(surf)
+            button = getattr(screen, button_name)
+
+            cpu = 0.0
+            for _ in range(frames):
+                button.hover = not button.hover
+                screen.mark_dirty(button.dirty_rect())
+
+                t0 = time.process_time()
+                area = manager.draw(surf, partial=partial)
+                if area is None:
+                    pygame.display.flip()
+                else:
+                    pygame.display.update(area)
+                cpu += time.process_time() - t0
+
+            results[name][mode] = cpu / frames * 1000.0
+            while manager.screens:
+                manager.pop()
+
+        print(
+            f"{name:<22} flip {results[name]['full_ms']:7.3f} ms"
+            f"   zonas {results[name]['dirty_ms']:7.3f} ms (CPU por frame)",
+            file=sys.stderr,
+        )
+    return results
+
+
+def micro_cases(surf):
+    """(nombre, función(i)) de cada microbenchmark"""
+    reset_game()
+    intro = load_level_spec("level1")["intro"]
+    button = Button((WIDTH // 2 - 150, HEIGHT // 2, 300, 70), "COMENZAR AVENTURA")
+
+    def hover_button(i):
+        button.hover = i % 2 == 0
+        button.draw(surf)
+
+    hud = HudLayer()
+
+    powerups = [
+        PowerUp(100 + 60 * k, 200, ("terere", "carrulim")[k % 2]) for k in range(4)
+    ]
+
+    def draw_powerups(i):
+        for p in powerups:
+            p.update(1 / TICK_RATE)
+            p.draw(surf)
+
+    return [
+        ("draw_text", lambda i: draw_text(surf, "HIJOS DE TAU", 26, 100, 100)),
+        (
+            "draw_text_changing",
+            lambda i: draw_text(surf, f"Puntaje: {i}", 26, 100, 100),
+        ),
+        (
+            "draw_text_fast_changing",
+            lambda i: draw_text_fast(surf, f"Puntaje: {i}", 26, 100, 100),
+        ),
+        ("draw_hud", lambda i: draw_hud(surf, GAME.nickname, i, 100 - i % 100)),
+        # Mismo HUD retenido con el puntaje fijo (frame típico: nada cambia)
+        ("HudLayer.draw", lambda i: hud.draw(surf, GAME.nickname, 1230, 55.5)),
+        (
+            "draw_intro_overlay",
+            lambda i: draw_intro_overlay(
+                surf, intro["title"], intro["lines"], 10 - i % 10, 255
+            ),
+        ),
+        ("Button.draw", hover_button),
+        ("PowerUp.draw x4", draw_powerups),
+    ]
+
+
+def bench_micro(surf, iterations):
+    results = {}
+    for name, fn in micro_cases(surf):
+        fn(0)  # Calentar cachés
+
+        t0 = time.perf_counter()
+        for i in range(iterations):
+            fn(i)
+        elapsed = time.perf_counter() - t0
+
+        # Memoria asignada por las llamadas, en una pasada aparte
+        calls = min(iterations, 200)
+        tracemalloc.start()
+        base, _ = tracemalloc.get_traced_memory()
+        for i in range(calls):
+            fn(i)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[name] = {
+            "us_per_call": elapsed / iterations * 1e6,
+            "alloc_peak_kb": (peak - base) / 1024.0,
+            "retained_kb": (current - base) / 1024.0,
+            "calls": iterations,
+        }
+        print(
+            f"{name:<24} {results[name]['us_per_call']:9.1f} us/llamada",
+            file=sys.stderr,
+        )
+    return results
+
+
+# ==================== TIEMPO HASTA EL PRIMER FRAME ====================
+STARTUP_LEVEL = "level4"  # El nivel con más imágenes (13 frames del Luisón)
+
+
+def first_frame(level_id):
+    """Arranca, construye el nivel y dibuja su primer frame; devuelve ms"""
+    t0 = time.perf_counter()
+    surf = bootstrap(headless=True)
+    reset_game()
+    manager = ScreenManager()
+    manager.push(LevelScreen(manager, level_id))
+    manager.update(STEP)
+    manager.draw(surf)
+    return (time.perf_counter() - t0) * 1000.0
+
+
+def run_first_frame(level_id, raw_cache):
+    """first_frame en un proceso nuevo (raw_cache vacío = sin caché en disco)"""
+    output = subprocess.run(
+        [sys.executable, __file__, "--first-frame", level_id, "--raw-cache", raw_cache],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return float(output.split()[-1])
+
+
+def bench_startup(runs):
+    """
+    Tiempo hasta el primer frame de STARTUP_LEVEL en procesos nuevos (ms):
+    - decode_ms: sin caché en disco, decodificando PNG/JPG
+    - cold_ms: caché en disco vacío (decodifica y además lo escribe)
+    - warm_ms: segundo arranque, con los píxeles ya en disco (mmap)
+    """
+    times = {"decode_ms": [], "cold_ms": [], "warm_ms": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        for run in range(runs):
+            cache = os.path.join(tmp, f"raw{run}")
+            times["decode_ms"].append(run_first_frame(STARTUP_LEVEL, ""))
+            times["cold_ms"].append(run_first_frame(STARTUP_LEVEL, cache))
+            times["warm_ms"].append(run_first_frame(STARTUP_LEVEL, cache))
+
+    results = {mode: sorted(values)[len(values) // 2] for mode, values in times.items()}
+    print(
+        f"primer frame {STARTUP_LEVEL:<9} sin caché {results['decode_ms']:7.1f} ms"
+        f"   frío {results['cold_ms']:7.1f} ms   tibio {results['warm_ms']:7.1f} ms",
+        file=sys.stderr,
+    )
+    return results
+
+
+# ==================== COMPARACIÓN ====================
+def comparable_metrics(report):
+    """Aplana el reporte en {nombre de métrica: valor} para comparar"""
+    metrics = {}
+    for name, data in report.get("screens", {}).items():
+        for phase in ("update_ms", "draw_ms", "alloc_blocks"):
+            for stat in ("p50", "p95"):
+                value = data.get(phase, {}).get(stat)
+                if value is not None:
+                    metrics[f"{name}.{phase}.{stat}"] = value
+    for name, data in report.get("micro", {}).items():
+        metrics[f"{name}.us_per_call"] = data["us_per_call"]
+    for name, data in report.get("present", {}).items():
+        for mode, value in data.items():
+            metrics[f"{name}.present.{mode}"] = value
+    for mode, value in report.get("startup", {}).items():
+        metrics[f"startup.{mode}"] = value
+    return metrics
+
+
+def compare(report, baseline, threshold, min_delta, min_blocks):
+    """Imprime la diferencia con la base; devuelve las métricas que empeoraron"""
+    current = comparable_metrics(report)
+    base = comparable_metrics(baseline)
+
+    regressions = []
+    print(f"{'métrica':<40}{'base':>10}{'actual':>10}{'cambio':>10}")
+    for key in sorted(current):
+        if key not in base:
+            continue
+        old, new = base[key], current[key]
+        change = (new - old) / old * 100 if old else 0.0
+        mark = ""
+        # Las métricas muy chicas son ruido: también se exige un cambio absoluto
+        floor = min_blocks if ".alloc_blocks." in key else min_delta
+        if change > threshold and new - old > floor:
+            mark = "  REGRESIÓN"
+            regressions.append(key)
+        print(f"{key:<40}{old:>10.3f}{new:>10.3f}{change:>+9.1f}%{mark}")
+    return regressions
+
+
+# ==================== PUNTO DE ENTRADA ====================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark headless del juego")
+    parser.add_argument("--frames", type=int, default=600, help="frames por pantalla")
+    parser.add_argument(
+        "--alloc-frames",
+        type=int,
+        default=60,
+        help="frames medidos con tracemalloc por pantalla",
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=2000, help="llamadas por microbenchmark"
+    )
+    parser.add_argument("--out", default="benchmark.json", help="archivo de salida")
+    parser.add_argument("--compare", metavar="BASE", help="reporte base a comparar")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="porcentaje de empeoramiento que cuenta como regresión",
+    )
+    parser.add_argument(
+        "--min-delta",
+        type=float,
+        default=0.05,
+        help="cambio absoluto mínimo (ms o us) para contar como regresión",
+    )
+    parser.add_argument(
+        "--min-blocks",
+        type=int,
+        default=1,
+        help="bloques por frame de más que se toleran sin contar como regresión",
+    )
+    parser.add_argument(
+        "--startup-runs",
+        type=int,
+        default=3,
+        help="arranques por modo al medir el tiempo hasta el primer frame",
+    )
+    # Uso interno: un proceso hijo por arranque medido
+    parser.add_argument("--first-frame", metavar="NIVEL", help=argparse.SUPPRESS)
+    parser.add_argument("--raw-cache", default="", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.first_frame:
+        ASSETS.disk = RawImageCache(args.raw_cache) if args.raw_cache else None
+        print(f"{first_frame(args.first_frame):.3f}")
+        return 0
+
+    surf = bootstrap(headless=True)
+
+    report = {
+        "meta": {
+            "frames": args.frames,
+            "alloc_frames": args.alloc_frames,
+            "iterations": args.iterations,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+        },
+        "screens": bench_screens(surf, args.frames, args.alloc_frames),
+        "micro": bench_micro(surf, args.iterations),
+        "present": bench_present(surf, args.frames),
+        "startup": bench_startup(args.startup_runs),
+    }
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1)
+    print(f"Resultados guardados en {args.out}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(report, baseline, args.threshold, args.min_delta, args.min_blocks):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,16 @@
+import os
 import pygame
 import sys
+from fonts import get_font, get_atlas, render_text, render_text_alpha
 
 # ==================== CONFIGURACIÓN GENERAL ====================
 WIDTH, HEIGHT = 1200, 720
 FPS = 60
+TICK_RATE = 60  # Pasos de simulación por segundo (paso fijo)
+MAX_CATCH_UP_STEPS = 5  # Pasos máximos a recuperar por frame tras un tirón
+IDLE_WAIT_MS = 50  # Espera máxima por eventos en pantallas quietas (menús)
+DIRTY_RECTS = True  # Redibujar y actualizar solo las zonas que cambiaron
+DIRTY_RECT_MAX_FRACTION = 0.3  # Si cambia más que esto de la pantalla: flip
 BG_COLOR = (18, 18, 24)
 
 # ==================== PALETA DE COLORES ====================
@@ -29,25 +36,70 @@ COLOR_SHADOW = (0, 0, 0)
 COLOR_INTRO_TEXT = (255, 255, 230)
 
 # ==================== INICIALIZACIÓN DE PYGAME ====================
-pygame.init()
-pygame.mixer.init()
-
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Paraguayito: Hijos de Tau y Kerana")
+# Importar los módulos del juego NO abre ventana ni dispositivo de audio:
+# eso lo hace bootstrap(), que main() llama antes de crear las pantallas.
+screen = None  # Superficie de la ventana (la crea bootstrap)
 clock = pygame.time.Clock()
 
+
+def bootstrap(headless=False):
+    """
+    Inicializa pantalla, audio y mando.
+
+    Args:
+        headless: Si True usa los drivers "dummy" de SDL (sin ventana ni
+            audio reales) y no busca mandos. Sirve para tests, benchmarks
+            y simulaciones por lotes.
+
+    Retorna la superficie de la ventana.
+    """
+    global screen
+
+    if headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+        pygame.display.init()
+        pygame.font.init()
+    else:
+        pygame.init()
+
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        print("⚠️  No se pudo iniciar el audio")
+
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Paraguayito: Hijos de Tau y Kerana")
+
+    if not headless:
+        from joystickmanager import JOYSTICK
+
+        JOYSTICK.init()
+
+    return screen
+
+
+def stop_music():
+    """Detiene la música de fondo (si hay audio disponible)"""
+    if pygame.mixer.get_init():
+        pygame.mixer.music.stop()
+
+
 # ==================== FUENTES GLOBALES ====================
+# Todas pasan por el registro de fonts.py: get_font() con los mismos
+# parámetros devuelve siempre el mismo objeto
 # Fuentes base
-FONT = pygame.font.SysFont("dejavusans", 20)
-BIGFONT = pygame.font.SysFont("dejavusans", 40)
-SMALL = pygame.font.SysFont("dejavusans", 16)
+FONT = get_font("dejavusans", 20)
+BIGFONT = get_font("dejavusans", 40)
+SMALL = get_font("dejavusans", 16)
 
 # Fuentes especializadas (para evitar recrearlas constantemente)
-HUD_FONT = pygame.font.SysFont("dejavusans", 26, bold=True)
-TITLE_FONT = pygame.font.SysFont("dejavusans", 110, bold=True)
-BODY_FONT = pygame.font.SysFont("dejavusans", 30, bold=True)
-SUBTITLE_FONT = pygame.font.SysFont("dejavusans", 32, bold=True)
-BOSS_NAME_FONT = pygame.font.SysFont("dejavusans", 28, bold=True)
+HUD_FONT = get_font("dejavusans", 26, bold=True)
+TITLE_FONT = get_font("dejavusans", 110, bold=True)
+BODY_FONT = get_font("dejavusans", 30, bold=True)
+SUBTITLE_FONT = get_font("dejavusans", 32, bold=True)
+BOSS_NAME_FONT = get_font("dejavusans", 28, bold=True)
+DEBUG_FONT = get_font("monospace", 14)
 
 # ==================== CONSTANTES DE JUEGO ====================
 # Vida
@@ -66,6 +118,25 @@ POWERUP_SPEED_MULTIPLIER = 1.5
 POWERUP_SPAWN_INTERVAL = 5.0  # Segundos entre power-ups
 POWERUP_DURATION = 5.0  # Duración del carrulim en segundos
 
+# Ataque con machete
+MACHETE_SWING_AMPLITUDE = 25  # Grados máximos del balanceo
+MACHETE_ANGLE_STEP = 5  # Cuantización de los ángulos precalculados (grados)
+
+# Caché de imágenes
+ASSET_CACHE_BUDGET = 128 * 1024 * 1024  # Bytes máximos antes de descartar (LRU)
+SPRITE_PACK_DIR = ".cache/sprites"  # Hojas de sprites de spritepack.py
+RAW_CACHE_DIR = ".cache/raw"  # Píxeles ya escalados (mmap); None = desactivado
+
+# Carga asíncrona (ver loader.py)
+ASSET_LOADER_WORKERS = 2  # Hilos que decodifican imágenes y sonidos
+LOADER_POLL_BUDGET_MS = 4  # Tiempo por frame para terminar cargas (hilo principal)
+
+# Colisiones
+SPATIAL_CELL_SIZE = 128  # Lado de las celdas del índice espacial (px)
+
+# Perfilador (F3)
+PROFILER_HISTORY = 240  # Frames guardados por fase y por pantalla
+
 
 # ==================== FUNCIONES HELPER ====================
 def draw_text(surf, text, size, x, y, color=COLOR_TEXT_DEFAULT, center=False):
@@ -87,7 +158,7 @@ def draw_text(surf, text, size, x, y, color=COLOR_TEXT_DEFAULT, center=False):
     else:
         f = FONT
 
-    txt = f.render(text, True, color)
+    txt = render_text(text, f, color)
     rect = txt.get_rect()
 
     if center:
@@ -98,6 +169,28 @@ def draw_text(surf, text, size, x, y, color=COLOR_TEXT_DEFAULT, center=False):
     surf.blit(txt, rect)
 
 
+def draw_text_fast(surf, text, size, x, y, color=COLOR_TEXT_DEFAULT, center=False):
+    """
+    Como draw_text, pero arma el texto con glifos ya rasterizados
+    (ver fonts.GlyphAtlas): para números y textos que cambian casi en
+    cada frame, donde el caché de textos renderizados no sirve.
+    """
+    if size >= 32:
+        f = BIGFONT
+    elif size <= 14:
+        f = SMALL
+    else:
+        f = FONT
+
+    atlas = get_atlas(f, color)
+    if center:
+        width, height = atlas.size(text)
+        x -= width // 2
+        y -= height // 2
+
+    atlas.draw(surf, text, (x, y))
+
+
 def draw_health_bar(
     surf, x, y, width, height, current_hp, max_hp, color=COLOR_HP_GREEN
 ):
@@ -157,7 +250,9 @@ def draw_boss_health_bar(surf, boss_name, current_hp, max_hp, color=COLOR_HP_ORA
     )
 
 
-def draw_enemy_health_bar(surf, x, y, width, height, current_hp, max_hp):
+def draw_enemy_health_bar(
+    surf, x, y, width, height, current_hp, max_hp, color=COLOR_HP_RED
+):
     """
     Dibuja una pequeña barra de vida sobre un enemigo común.
 
@@ -167,6 +262,7 @@ def draw_enemy_health_bar(surf, x, y, width, height, current_hp, max_hp):
         width, height: Dimensiones de la barra
         current_hp: Vida actual
         max_hp: Vida máxima
+        color: Color de la barra de vida
     """
     ratio = max(0, min(1, current_hp / max_hp))
 
@@ -174,7 +270,7 @@ def draw_enemy_health_bar(surf, x, y, width, height, current_hp, max_hp):
     pygame.draw.rect(surf, COLOR_HP_BG, (x, y, width, height))
 
     # Vida
-    pygame.draw.rect(surf, COLOR_HP_RED, (x, y, width * ratio, height))
+    pygame.draw.rect(surf, color, (x, y, width * ratio, height))
 
     # Borde
     pygame.draw.rect(surf, COLOR_WHITE, (x, y, width, height), 1)
@@ -191,32 +287,54 @@ def draw_hud(surf, nickname, score, health):
         health: Vida actual del jugador
     """
     # Texto del jugador
-    txt_jugador = HUD_FONT.render(f"Jugador: {nickname}", True, COLOR_WHITE)
+    txt_jugador = render_text(f"Jugador: {nickname}", HUD_FONT, COLOR_WHITE)
     surf.blit(txt_jugador, (12, 12))
 
     # Texto del puntaje
-    txt_puntaje = HUD_FONT.render(f"Puntaje: {score}", True, COLOR_TEXT_YELLOW)
+    txt_puntaje = render_text(f"Puntaje: {score}", HUD_FONT, COLOR_TEXT_YELLOW)
     surf.blit(txt_puntaje, (12, 48))
 
     # Barra de vida
     draw_health_bar(surf, 12, 80, 200, 20, health, PLAYER_MAX_HP, COLOR_HP_GREEN)
 
 
-def draw_intro_overlay(surf, title, story_lines, countdown, text_alpha):
+_OVERLAYS = {}  # (r, g, b, a) -> superficie de pantalla completa
+
+
+def get_overlay(color):
+    """
+    Overlay semitransparente de pantalla completa, creado una sola vez
+    por color. No modificarlo: es compartido.
+    """
+    color = tuple(color)
+    overlay = _OVERLAYS.get(color)
+    if overlay is None:
+        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+        overlay.fill(color)
+        _OVERLAYS[color] = overlay
+    return overlay
+
+
+def draw_intro_overlay(
+    surf, title, story_lines, countdown, text_alpha, overlay_alpha=120
+):
     """
     Dibuja la pantalla de introducción de un nivel.
 
     Args:
         surf: Superficie donde dibujar
-        title: Título del nivel (ej: "NIVEL 1")
+        title: Título del nivel (ej: "NIVEL 1"), se muestra como primera línea
         story_lines: Lista de líneas de historia
         countdown: Tiempo restante para comenzar
         text_alpha: Transparencia del texto (0-255)
+        overlay_alpha: Oscurecimiento del fondo (0-255); 0 si el fondo
+            ya viene oscurecido
     """
     # Overlay oscuro
-    overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 120))
-    surf.blit(overlay, (0, 0))
+    if overlay_alpha:
+        surf.blit(get_overlay((0, 0, 0, overlay_alpha)), (0, 0))
+
+    story_lines = [title, ""] + list(story_lines)
 
     # Calcular posición inicial
     y = HEIGHT // 2 - len(story_lines) * 22
@@ -226,20 +344,18 @@ def draw_intro_overlay(surf, title, story_lines, countdown, text_alpha):
         alpha_line = max(0, min(255, text_alpha - i * 12))
         if alpha_line > 0:
             # Sombra
-            txt_shadow = BODY_FONT.render(linea, True, COLOR_BLACK)
-            txt_shadow.set_alpha(alpha_line)
+            txt_shadow = render_text_alpha(linea, BODY_FONT, COLOR_BLACK, alpha_line)
             surf.blit(txt_shadow, txt_shadow.get_rect(center=(WIDTH // 2 + 2, y + 2)))
 
             # Texto principal
-            txt = BODY_FONT.render(linea, True, COLOR_INTRO_TEXT)
-            txt.set_alpha(alpha_line)
+            txt = render_text_alpha(linea, BODY_FONT, COLOR_INTRO_TEXT, alpha_line)
             surf.blit(txt, txt.get_rect(center=(WIDTH // 2, y)))
 
         y += 48
 
     # Contador de inicio (solo cuando el texto está completamente visible)
     if text_alpha >= 240:
-        draw_text(
+        draw_text_fast(
             surf,
             f"COMIENZA EN {int(countdown) + 1}",
             56,
@@ -261,7 +377,6 @@ def draw_debug_info(surf, fps, player_pos, enemies_count):
         player_pos: Posición del jugador (x, y)
         enemies_count: Número de enemigos vivos
     """
-    debug_font = pygame.font.SysFont("monospace", 14)
     debug_lines = [
         f"FPS: {int(fps)}",
         f"Pos: ({int(player_pos[0])}, {int(player_pos[1])})",
@@ -270,7 +385,7 @@ def draw_debug_info(surf, fps, player_pos, enemies_count):
 
     y = 10
     for line in debug_lines:
-        txt = debug_font.render(line, True, (0, 255, 0))
+        txt = render_text(line, DEBUG_FONT, (0, 255, 0))
         surf.blit(txt, (WIDTH - 150, y))
         y += 20
 
@@ -4,6 +4,37 @@ from config import WIDTH, HEIGHT, draw_text
 
 
 class Enemy:
+    # Sin __dict__: menos memoria por enemigo y acceso más rápido a atributos
+    __slots__ = (
+        "whip_active",
+        "whip_start",
+        "whip_duration",
+        "whip_rect",
+        "whip_hit",
+        "x",
+        "y",
+        "prev_x",
+        "prev_y",
+        "w",
+        "h",
+        "facing_right",
+        "hitbox_offset_x",
+        "hitbox_offset_y",
+        "hitbox_width_reduce",
+        "hitbox_height_reduce",
+        "hitbox",
+        "hp",
+        "max_hp",
+        "speed",
+        "name",
+        "color",
+        "state",
+        "dir",
+        "timer",
+        "anim_timer",
+        "current_frame",
+    )
+
     def __init__(self, x, y, name="enemy", hp=30, speed=60, w=36, h=36):
         self.whip_active = False
         self.whip_start = 0
@@ -13,16 +44,17 @@ class Enemy:
 
         self.x = x
         self.y = y
+        # Posición del paso anterior (para interpolar al dibujar)
+        self.prev_x = x
+        self.prev_y = y
         self.w = w
         self.h = h
 
         # 🔥 Fix: ahora todos los enemigos tienen dirección visual
         self.facing_right = False
 
-        self.hitbox_offset_x = 0
-        self.hitbox_offset_y = 0
-        self.hitbox_width_reduce = 0
-        self.hitbox_height_reduce = 0
+        # Hitbox: un solo Rect que rect() actualiza en el lugar
+        self.set_hitbox(0, 0, 0, 0)
 
         self.hp = hp
         self.max_hp = hp
@@ -34,16 +66,44 @@ class Enemy:
         self.dir = random.choice([-1, 1])
         self.timer = 0
 
+        # Animación (la maneja el nivel)
+        self.anim_timer = 0
+        self.current_frame = 0
+
+    def set_hitbox(self, offset_x, offset_y, width_reduce, height_reduce):
+        """Define la hitbox relativa al sprite; el tamaño se calcula una vez"""
+        self.hitbox_offset_x = offset_x
+        self.hitbox_offset_y = offset_y
+        self.hitbox_width_reduce = width_reduce
+        self.hitbox_height_reduce = height_reduce
+        # Asegurar que la caja nunca tenga tamaño negativo
+        w = max(1, self.w - width_reduce)
+        h = max(1, self.h - height_reduce)
+        self.hitbox = pygame.Rect(0, 0, w, h)
+
     # HITBOX donde recibe daño y hace daño por contacto
     def rect(self):
-        # Aplicar offsets y asegurar que la caja nunca tenga tamaño negativo
-        x = self.x + self.hitbox_offset_x
-        y = self.y + self.hitbox_offset_y
-        w = max(1, self.w - self.hitbox_width_reduce)
-        h = max(1, self.h - self.hitbox_height_reduce)
-        return pygame.Rect(x, y, w, h)
+        """
+        Devuelve la hitbox en la posición actual. Es SIEMPRE el mismo Rect
+        (se mueve en el lugar, sin crear uno nuevo): no guardarlo esperando
+        que no cambie. int() trunca igual que pygame.Rect(x, y, ...).
+        """
+        r = self.hitbox
+        r.x = int(self.x + self.hitbox_offset_x)
+        r.y = int(self.y + self.hitbox_offset_y)
+        return r
+
+    def lerp_pos(self, alpha):
+        """Posición interpolada entre el paso anterior y el actual"""
+        return (
+            self.prev_x + (self.x - self.prev_x) * alpha,
+            self.prev_y + (self.y - self.prev_y) * alpha,
+        )
 
     def update(self, dt, player):
+        self.prev_x = self.x
+        self.prev_y = self.y
+
         distx = player.x - self.x
         disty = player.y - self.y
         dist = (distx**2 + disty**2) ** 0.5
@@ -0,0 +1,184 @@
+import pygame
+from collections import OrderedDict
+
+# Máximo de textos renderizados que se guardan en memoria
+TEXT_CACHE_MAX_ENTRIES = 512
+
+
+# ==================== REGISTRO DE FUENTES ====================
+_FONTS = {}  # (familia, tamaño, negrita) -> pygame.font.Font
+
+
+def get_font(family, size, bold=False):
+    """
+    Devuelve la fuente pedida creándola solo la primera vez.
+    pygame.font.SysFont consulta fontconfig en cada llamada,
+    así que NUNCA debe llamarse dentro de draw().
+    """
+    key = (family, size, bold)
+    font = _FONTS.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.SysFont(family, size, bold=bold)
+        _FONTS[key] = font
+    return font
+
+
+# ==================== CACHÉ DE TEXTOS RENDERIZADOS ====================
+class TextCache:
+    """
+    Caché LRU de superficies de texto ya rasterizadas.
+    La clave es (texto, fuente, color, antialias): un texto estático
+    se rasteriza una sola vez aunque se dibuje en cada frame.
+
+    Las superficies devueltas son compartidas: NO modificarlas (set_alpha,
+    fill, blit encima). Para texto semitransparente usar render_text_alpha.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+        # Contadores
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, font, color, antialias=True):
+        """Equivalente a font.render(text, antialias, color) pero cacheado"""
+        key = (text, font, tuple(color), antialias)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.entries[key] = surface
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Vacía el caché (los contadores se mantienen)"""
+        self.entries.clear()
+
+    def stats(self):
+        """Devuelve los contadores del caché"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self.entries),
+            "fonts": len(_FONTS),
+        }
+
+
+# Instancia global del caché de textos
+TEXT_CACHE = TextCache(TEXT_CACHE_MAX_ENTRIES)
+
+
+def render_text(text, font, color, antialias=True):
+    """Atajo para TEXT_CACHE.render"""
+    return TEXT_CACHE.render(text, font, color, antialias)
+
+
+def render_text_alpha(text, font, color, alpha, antialias=True):
+    """
+    Como render_text pero con transparencia (0-255). Con alpha parcial
+    devuelve una copia propia: la entrada del caché no se toca.
+    """
+    surface = TEXT_CACHE.render(text, font, color, antialias)
+    if alpha >= 255:
+        return surface
+    surface = surface.copy()
+    surface.set_alpha(alpha)
+    return surface
+
+
+# ==================== ATLAS DE GLIFOS ====================
+# Caracteres que se rasterizan al crear un atlas (ASCII imprimible);
+# cualquier otro se agrega la primera vez que aparece
+GLYPH_CHARSET = "".join(chr(c) for c in range(32, 127))
+
+
+class GlyphAtlas:
+    """
+    Todos los caracteres de una fuente y un color rasterizados una sola vez
+    en una superficie. Un texto se arma copiando glifo por glifo y avanzando
+    el ancho de avance de cada uno (sin kerning), así que un texto que cambia
+    en cada frame (puntaje, cuentas regresivas) cuesta un blit por carácter
+    y nunca pasa por FreeType.
+
+    El resultado puede diferir en algún píxel de font.render (que sí aplica
+    kerning): usarlo solo para números y textos dinámicos.
+    """
+
+    def __init__(self, font, color, antialias=True, charset=GLYPH_CHARSET):
+        self.font = font
+        self.color = tuple(color)
+        self.antialias = antialias
+        self.glyphs = {}  # carácter -> (superficie, área, avance)
+
+        # Una tira con todos los glifos del charset
+        rendered = [(ch, font.render(ch, antialias, self.color)) for ch in charset]
+        width = sum(surface.get_width() for _, surface in rendered)
+        self.height = max([font.get_height()] + [s.get_height() for _, s in rendered])
+        self.surface = pygame.Surface((max(1, width), self.height), pygame.SRCALPHA)
+        x = 0
+        for ch, surface in rendered:
+            self.surface.blit(surface, (x, 0))
+            area = pygame.Rect(x, 0, surface.get_width(), surface.get_height())
+            self.glyphs[ch] = (self.surface, area, self.advance(ch, surface))
+            x += surface.get_width()
+
+    def advance(self, ch, surface):
+        """Ancho de avance del carácter (el del glifo si la fuente no lo da)"""
+        metrics = self.font.metrics(ch)
+        if metrics and metrics[0]:
+            return metrics[0][4]
+        return surface.get_width()
+
+    def glyph(self, ch):
+        entry = self.glyphs.get(ch)
+        if entry is None:
+            surface = self.font.render(ch, self.antialias, self.color)
+            entry = (surface, None, self.advance(ch, surface))
+            self.glyphs[ch] = entry
+        return entry
+
+    def size(self, text):
+        """(ancho, alto) que ocupa el texto"""
+        return sum(self.glyph(ch)[2] for ch in text), self.height
+
+    def layout(self, text, x, y):
+        """(fuente, posición, área) de cada glifo, listo para Surface.blits"""
+        sequence = []
+        for ch in text:
+            source, area, advance = self.glyph(ch)
+            sequence.append((source, (x, y), area))
+            x += advance
+        return sequence
+
+    def draw(self, surf, text, pos):
+        """Dibuja el texto con su esquina superior izquierda en pos"""
+        surf.blits(self.layout(text, *pos), doreturn=False)
+
+    def render(self, text):
+        """Superficie nueva con el texto, como font.render pero sin FreeType"""
+        surface = pygame.Surface(self.size(text), pygame.SRCALPHA)
+        surface.blits(self.layout(text, 0, 0), doreturn=False)
+        return surface
+
+
+_ATLASES = {}  # (fuente, color, antialias) -> GlyphAtlas
+
+
+def get_atlas(font, color, antialias=True):
+    """Atlas de una fuente y un color, creado la primera vez que se pide"""
+    key = (font, tuple(color), antialias)
+    atlas = _ATLASES.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(font, color, antialias)
+        _ATLASES[key] = atlas
+    return atlas
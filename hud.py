@@ -0,0 +1,80 @@
+import pygame
+from config import (
+    HUD_FONT,
+    PLAYER_MAX_HP,
+    COLOR_WHITE,
+    COLOR_TEXT_YELLOW,
+    COLOR_HP_BG,
+    COLOR_HP_GREEN,
+)
+from fonts import get_atlas, render_text
+
+
+# ==================== CAMPO RETENIDO ====================
+class HudField:
+    """
+    Una parte del HUD guardada ya dibujada.
+    get(key) solo llama a build(key) cuando la clave cambia: mientras el
+    valor mostrado sea el mismo, dibujar el campo es un blit.
+    """
+
+    __slots__ = ("build", "key", "surface")
+
+    def __init__(self, build):
+        self.build = build  # función(clave) -> superficie
+        self.key = None
+        self.surface = None
+
+    def get(self, key):
+        if self.surface is None or key != self.key:
+            self.key = key
+            self.surface = self.build(key)
+        return self.surface
+
+
+# ==================== HUD DEL NIVEL ====================
+class HudLayer:
+    """
+    HUD de los niveles (nombre, puntaje y barra de vida) en modo retenido.
+    Es el mismo HUD que config.draw_hud, pero cada texto se renderiza solo
+    cuando cambia GAME.nickname o GAME.score y la barra solo cuando la
+    vida cambia lo suficiente como para mover un píxel de la barra.
+    El puntaje se arma con fonts.GlyphAtlas (sin kerning).
+    """
+
+    BAR_X = 12
+    BAR_Y = 80
+    BAR_WIDTH = 200
+    BAR_HEIGHT = 20
+
+    def __init__(self):
+        self.nickname = HudField(
+            lambda nickname: render_text(f"Jugador: {nickname}", HUD_FONT, COLOR_WHITE)
+        )
+        # El puntaje cambia con cada golpe: se arma con el atlas de glifos
+        score_atlas = get_atlas(HUD_FONT, COLOR_TEXT_YELLOW)
+        self.score = HudField(lambda score: score_atlas.render(f"Puntaje: {score}"))
+        self.health = HudField(self.build_health_bar)
+
+    def bar_pixels(self, health):
+        """Píxeles llenos de la barra (draw.rect trunca el ancho)"""
+        ratio = max(0, min(1, health / PLAYER_MAX_HP))
+        return int(self.BAR_WIDTH * ratio)
+
+    def build_health_bar(self, pixels):
+        """
+        Igual que config.draw_health_bar pero con el ancho ya en píxeles
+        (recalcular el ratio desde los píxeles puede perder uno al redondear).
+        La barra es opaca: se dibuja una vez y se copia tal cual.
+        """
+        bar = pygame.Surface((self.BAR_WIDTH, self.BAR_HEIGHT))
+        bar.fill(COLOR_HP_BG)
+        pygame.draw.rect(bar, COLOR_HP_GREEN, (0, 0, pixels, self.BAR_HEIGHT))
+        pygame.draw.rect(bar, COLOR_WHITE, bar.get_rect(), 2)
+        return bar
+
+    def draw(self, surf, nickname, score, health):
+        """Mismos argumentos que config.draw_hud"""
+        surf.blit(self.nickname.get(nickname), (12, 12))
+        surf.blit(self.score.get(score), (12, 48))
+        surf.blit(self.health.get(self.bar_pixels(health)), (self.BAR_X, self.BAR_Y))
@@ -11,6 +11,11 @@ class JoystickManager:
         self.joystick = None
         self.connected = False
 
+    def init(self):
+        """
+        Inicializa el sistema de joystick y busca un mando.
+        Lo llama config.bootstrap(); importar este módulo no toca el hardware.
+        """
         # Inicializar sistema de joystick
         pygame.joystick.init()
 
@@ -95,7 +100,7 @@ class JoystickManager:
 
     def update(self):
         """Actualiza el estado del joystick"""
-        if not self.connected:
+        if not self.connected and pygame.joystick.get_init():
             # Intentar reconectar si se desconectó
             if pygame.joystick.get_count() > 0:
                 self.joystick = pygame.joystick.Joystick(0)
@@ -1,21 +1,488 @@
 import pygame
 import random
-from config import WIDTH, HEIGHT, draw_text
+import json
+from config import (
+    WIDTH,
+    HEIGHT,
+    TITLE_FONT,
+    SUBTITLE_FONT,
+    draw_text,
+    draw_boss_health_bar,
+    draw_enemy_health_bar,
+    draw_intro_overlay,
+    get_overlay,
+    stop_music,
+)
+from fonts import get_font
+from assets import ASSETS, composite, composite_background, frame_images
+from assets import load_frames, load_image
 from enemy import Enemy
-from pages import ScreenBase
+from swarm import make_swarm
+from pages import LoadingScreen, ScreenBase
 from game_state import GAME
+from powerup import PowerUpManager
+from hud import HudLayer
+from joystickmanager import JOYSTICK
+from loader import LOADER, image_request, music_request
+
+# Carpeta con la definición de cada nivel (niveles/<id>.json)
+LEVELS_DIR = "niveles"
+
+_SPECS = {}  # id -> definición ya leída
+
+VICTORY_BACKGROUND = "imagenes/victoryscreen.jpg"
+
+
+def load_level_spec(level_id):
+    """Lee (una sola vez) la definición JSON de un nivel"""
+    spec = _SPECS.get(level_id)
+    if spec is None:
+        with open(f"{LEVELS_DIR}/{level_id}.json", encoding="utf-8") as f:
+            spec = json.load(f)
+        spec["id"] = level_id
+        _SPECS[level_id] = spec
+    return spec
+
+
+def level_images(spec):
+    """
+    Imágenes que carga un nivel, como (ruta, tamaño, modo).
+    LevelScreen las pide con exactamente estos parámetros, así que la
+    precarga deja listas las mismas claves del caché.
+    """
+    images = [(spec["background"], (WIDTH, HEIGHT), "opaque")]
+    for entity in ("enemies", "boss"):
+        frames = spec[entity]["frames"]
+        images += frame_images(frames["folder"], frames["count"], frames["size"])
+    return images
+
+
+def screen_requests(screen_id):
+    """
+    Pedidos de carga (ver loader.py) de la pantalla screen_id: el id de
+    un nivel o "victory"
+    """
+    if screen_id == "victory":
+        return [image_request(VICTORY_BACKGROUND, (WIDTH, HEIGHT), "opaque")]
+    spec = load_level_spec(screen_id)
+    requests = [image_request(*image) for image in level_images(spec)]
+    return requests + [music_request(spec["music"])]
+
+
+def build_screen(manager, screen_id):
+    """Crea la pantalla screen_id (sus recursos ya deberían estar cargados)"""
+    if screen_id == "victory":
+        return VictoryScreen(manager)
+    return LevelScreen(manager, screen_id)
+
+
+# ==================== MOTOR DE NIVELES ====================
+class LevelScreen(ScreenBase):
+    """
+    Nivel genérico: todo lo que cambia entre niveles (sprites, vida,
+    velocidad, hitboxes, límites, daño, puntaje, música, textos)
+    viene de niveles/<id>.json. Ver FORMATO DE LOS NIVELES al final.
+    """
+
+    def __init__(self, manager, level_id):
+        self.manager = manager
+        self.GAME = GAME
+        self.player = GAME.player
+        self.spec = load_level_spec(level_id)
+
+        self.powerup_manager = PowerUpManager()
+        self.hud = HudLayer()  # Textos y barra solo se re-renderizan al cambiar
+
+        self.boss_active = False
+        self.game_over = False
+        self.victory = False
+        self.victory_timer = 0
+
+        # Precarga de la próxima pantalla (arranca al aparecer el jefe)
+        self.preload = None  # LoadBatch del cargador asíncrono
+
+        # ==================== FONDO ====================
+        try:
+            self.bg_image = load_image(
+                self.spec["background"], (WIDTH, HEIGHT), mode="opaque"
+            )
+        except:
+            self.bg_image = None
+
+        # ==================== ANIMACIONES ====================
+        self.enemy_frames = self.entity_frames(self.spec["enemies"])
+        self.boss_frames = self.entity_frames(self.spec["boss"])
+
+        # ==================== ENEMIGOS ====================
+        self.enemies = self.spawn_enemies(self.spec["enemies"]["count"])
+
+        # ==================== JEFE ====================
+        boss_spec = self.spec["boss"]
+        self.boss = self.make_enemy(boss_spec, boss_spec["x"], boss_spec["y"])
+
+        # ==================== INTRO ====================
+        self.countdown = 10.0
+        self.text_alpha = 0
+        self.started = False
+
+    # ==================== CICLO DE VIDA ====================
+    def on_enter(self):
+        # La música arranca al mostrarse el nivel, no al construirlo
+        try:
+            pygame.mixer.music.load(self.spec["music"])
+            pygame.mixer.music.set_volume(self.spec["music_volume"])
+            pygame.mixer.music.play(-1)
+        except:
+            pass
+
+    def on_exit(self):
+        stop_music()
+
+    def unload(self):
+        # Soltar referencias para que el nivel no quede vivo en memoria
+        self.bg_image = None
+        self.enemy_frames = None
+        self.boss_frames = None
+        self.enemies = None
+        self.boss = None
+        self.powerup_manager = None
+        self.hud = None
+        if self.preload:
+            LOADER.cancel(self.preload)
+            self.preload = None
+        self.discard_intro_snapshot()
+
+    def screen_name(self):
+        # Cada nivel se perfila por separado
+        return f"LevelScreen:{self.spec['id']}"
+
+    @staticmethod
+    def entity_frames(entity_spec):
+        """Carga la animación de un enemigo o jefe"""
+        frames = entity_spec["frames"]
+        return load_frames(frames["folder"], frames["count"], tuple(frames["size"]))
+
+    def spawn_enemies(self, count):
+        """Crea el grupo de enemigos comunes según spawn del nivel"""
+        enemy_spec = self.spec["enemies"]
+        spawn = enemy_spec["spawn"]
+        positions = []
+        for i in range(count):
+            if "x_step" in spawn:
+                x = spawn["x"][0] + i * spawn["x_step"]
+            else:
+                x = random.randint(*spawn["x"])
+            y = random.randint(*spawn["y"])
+            positions.append((x, y))
+        return make_swarm(enemy_spec, positions, len(self.enemy_frames))
+
+    @staticmethod
+    def make_enemy(entity_spec, x, y):
+        """Crea un enemigo (o jefe) a partir de su definición"""
+        e = Enemy(
+            x,
+            y,
+            name=entity_spec["name"],
+            hp=entity_spec["hp"],
+            speed=entity_spec["speed"],
+            w=entity_spec["w"],
+            h=entity_spec["h"],
+        )
+        e.set_hitbox(*entity_spec["hitbox"])
+        return e
+
+    # ==================== EVENTOS ====================
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN:
+
+            if event.key == pygame.K_ESCAPE:
+                self.manager.pop()
+                return
+
+            # DEBUG saltar nivel
+            if event.key == pygame.K_p and self.spec["next"] != "victory":
+                self.advance(bonus=False)
+                return
+
+            if not self.started:
+                return
+
+            # ATAQUE
+            if event.key == pygame.K_SPACE:
+                self.attack()
+
+            # Pasar nivel
+            if event.key == pygame.K_RETURN and self.victory:
+                self.advance()
+
+    def attack(self):
+        """Golpe del machete contra enemigos y jefe"""
+        if self.game_over or self.victory:
+            return
+
+        atk = self.player.attack()
+        if not atk:
+            return
+
+        damage = getattr(self.player, "attack_damage", 30)
+        hits = self.enemies.hit(atk, damage)
+        if self.boss_active and atk.colliderect(self.boss.rect()):
+            self.boss.take_damage(damage)
+            hits += 1
+
+        if hits:
+            if self.player.sonido_golpe:
+                self.player.sonido_golpe.play()
+            self.GAME.score += self.spec["score_per_hit"] * hits
+
+    def start_preload(self):
+        """Empieza a cargar en segundo plano la próxima pantalla"""
+        if self.preload:
+            return
+        self.preload = LOADER.load(screen_requests(self.spec["next"]))
+
+    def advance(self, bonus=True):
+        """Reemplaza este nivel por la siguiente pantalla"""
+        if bonus:
+            self.GAME.score += self.spec["clear_bonus"]
+
+        # La precarga no se cancela: la pantalla de carga comparte sus
+        # pedidos en curso y solo espera lo que falte (si ya está todo,
+        # pasa de largo sin llegar a dibujarse)
+        self.preload = None
+        next_id = self.spec["next"]
+        self.manager.replace(
+            LoadingScreen(
+                self.manager,
+                screen_requests(next_id),
+                lambda manager: build_screen(manager, next_id),
+            )
+        )
+
+    # ==================== UPDATE ====================
+    def update(self, dt):
+
+        if not self.started:
+            self.countdown -= dt
+            self.text_alpha = min(255, self.text_alpha + dt * 80)
+            if self.countdown <= 0:
+                self.started = True
+                self.discard_intro_snapshot()
+            return
+
+        self.powerup_manager.update(dt, self.player)
+
+        if self.game_over:
+            return
+
+        if self.victory:
+            delay = self.spec["victory_delay"]
+            if delay is not None:
+                self.victory_timer += dt
+                if self.victory_timer >= delay:
+                    self.advance()
+            return
+
+        keys = pygame.key.get_pressed()
+        self.player.update(dt, keys)
+        self.clamp_top(self.player, self.spec["player_min_y"])
+
+        # ATAQUE JOYSTICK
+        if JOYSTICK.connected and JOYSTICK.is_attack_pressed():
+            self.attack()
+
+        # El jugador no se mueve durante el resto del update
+        hurt = self.player.hurt_rect()
+
+        # Todos los enemigos comunes se mueven juntos (ver swarm.py)
+        touching = self.enemies.update(dt, self.player, hurt)
+        self.player.health -= self.spec["enemies"]["contact_dps"] * dt * touching
+        self.enemies.remove_dead()
+
+        # Activar jefe
+        if not self.enemies and not self.boss_active:
+            self.boss_active = True
+            self.start_preload()
+
+        # JEFE
+        if self.boss_active and self.boss.hp > 0:
+            self.update_enemy(self.boss, dt, self.spec["boss"], self.boss_frames, hurt)
+
+        if self.player.health <= 0:
+            self.game_over = True
+            stop_music()
+
+        if self.boss_active and self.boss.hp <= 0:
+            self.victory = True
+            self.victory_timer = 0
+            stop_music()
+
+    def update_enemy(self, e, dt, entity_spec, frames, hurt):
+        """Movimiento, giro, animación y daño por contacto de un enemigo"""
+        e.update(dt, self.player)
+        self.clamp_top(e, entity_spec["min_y"])
+
+        # Girar hacia el jugador
+        e.facing_right = self.player.x > e.x
+
+        # Animación
+        if frames:
+            e.anim_timer += dt
+            if e.anim_timer >= entity_spec["frames"]["speed"]:
+                e.anim_timer = 0
+                e.current_frame = (e.current_frame + 1) % len(frames)
+
+        if e.rect().colliderect(hurt):
+            self.player.health -= entity_spec["contact_dps"] * dt
+
+    @staticmethod
+    def clamp_top(entity, min_y):
+        """Limita el movimiento vertical (None = sin límite superior)"""
+        if min_y is not None and entity.y < min_y:
+            entity.y = min_y
+        if entity.y + entity.h > HEIGHT:
+            entity.y = HEIGHT - entity.h
+
+    # ==================== DRAW ====================
+    def draw(self, surf, alpha=1.0):
+        # INTRO VISUAL
+        if not self.started:
+            # Durante la intro nada se mueve: la escena ya oscurecida se
+            # compone una vez y cada frame solo se dibuja el texto encima
+            surf.blit(composite(self.intro_key(), self.build_intro_snapshot), (0, 0))
+            intro = self.spec["intro"]
+            draw_intro_overlay(
+                surf,
+                intro["title"],
+                intro["lines"],
+                self.countdown,
+                self.text_alpha,
+                overlay_alpha=0,
+            )
+            return
+
+        # Solo se interpola mientras la simulación avanza
+        if self.game_over or self.victory:
+            alpha = 1.0
+        self.draw_scene(surf, alpha)
+
+        # ==================== FIN DEL NIVEL ====================
+        if self.game_over:
+            defeat = self.spec["defeat"]
+            draw_text(
+                surf,
+                defeat["text"],
+                defeat["size"],
+                WIDTH // 2,
+                HEIGHT // 2,
+                center=True,
+            )
+
+        if self.victory:
+            victory = self.spec["victory"]
+            draw_text(
+                surf,
+                victory["text"],
+                victory["size"],
+                WIDTH // 2,
+                HEIGHT // 2 + victory["y"],
+                center=True,
+            )
+            draw_text(
+                surf,
+                "ENTER para continuar",
+                victory["hint_size"],
+                WIDTH // 2,
+                HEIGHT // 2 + victory["hint_y"],
+                center=True,
+            )
+
+    def draw_scene(self, surf, alpha):
+        """Fondo, enemigos, jefe, jugador y HUD (todo menos los textos)"""
+        if self.bg_image:
+            surf.blit(self.bg_image, (0, 0))
+        else:
+            surf.fill(self.spec["bg_color"])
+
+        # ENEMIGOS + BARRA DE VIDA
+        enemy_spec = self.spec["enemies"]
+        bar = enemy_spec["bar"]
+        half_sprite = enemy_spec["frames"]["size"][0] // 2
+        if self.enemy_frames:
+            for ex, ey, index, facing_right, hp in self.enemies.draw_items(alpha):
+                frame = self.enemy_frames.get(index, facing_right)
+                surf.blit(frame, (ex, ey))
+
+                draw_enemy_health_bar(
+                    surf,
+                    ex + half_sprite - 30,
+                    ey + bar["offset_y"],
+                    60,
+                    6,
+                    hp,
+                    bar["max_hp"],
+                    bar["color"],
+                )
+
+        # JEFE + BARRA ÉPICA
+        if self.boss_active and self.boss.hp > 0:
+            boss_spec = self.spec["boss"]
+            if self.boss_frames:
+                img = self.boss_frames.get(
+                    self.boss.current_frame, self.boss.facing_right
+                )
+                surf.blit(img, self.boss.lerp_pos(alpha))
+
+            draw_boss_health_bar(
+                surf,
+                boss_spec["label"],
+                self.boss.hp,
+                boss_spec["bar"]["max_hp"],
+                color=boss_spec["bar"]["color"],
+            )
+
+        # JUGADOR + HUD
+        self.player.draw(surf, alpha)
+        self.powerup_manager.draw(surf)
+        self.powerup_manager.draw_hud(surf, 12, 120)
+        self.hud.draw(surf, self.GAME.nickname, self.GAME.score, self.player.health)
+
+    # ==================== INSTANTÁNEA DE LA INTRO ====================
+    def intro_key(self):
+        # Cada instancia tiene su propia instantánea (los spawns cambian)
+        return ("intro", id(self))
+
+    def build_intro_snapshot(self):
+        """Escena inicial del nivel + oscurecido de la intro, en una superficie"""
+        snapshot = pygame.Surface((WIDTH, HEIGHT))
+        self.draw_scene(snapshot, 1.0)
+        alpha = self.spec["intro"]["overlay_alpha"]
+        if alpha:
+            snapshot.blit(get_overlay((0, 0, 0, alpha)), (0, 0))
+        return snapshot
+
+    def discard_intro_snapshot(self):
+        key = ("composite",) + self.intro_key()
+        ASSETS.discard(lambda k: k == key)
 
 
 # ==================== PANTALLA DE VICTORIA FINAL ====================
 class VictoryScreen(ScreenBase):
     """Pantalla que aparece al completar todos los niveles"""
+
     def __init__(self, manager):
         # Importación tardía para evitar ciclos
         from game_state import GAME
-        
+
         self.manager = manager
         self.GAME = GAME  # Guardamos referencia local
-        
+
+        # Puntaje: se re-renderiza solo cuando cambia GAME.score
+        self.font_sub = SUBTITLE_FONT
+        self.score_value = None
+        self.score_surf = None
+        self.score_rect = None
+
     def handle_event(self, event):
         if event.type == pygame.KEYDOWN:
             # Reiniciar el juego
@@ -23,65 +490,101 @@ class VictoryScreen(ScreenBase):
                 self.GAME.score = 0
                 self.GAME.player.health = 100
                 # Volver al inicio
-                while len(self.manager.screens) > 1:
-                    self.manager.pop()
-            
+                self.manager.reset_to()
+
             # Volver al menú principal
             if event.key == pygame.K_ESCAPE:
                 self.GAME.score = 0
-                while len(self.manager.screens) > 1:
-                    self.manager.pop()
-    
+                self.manager.reset_to()
+
+    def unload(self):
+        self.score_surf = None
+
     def update(self, dt):
         pass
-    
-    def draw(self, surf):
-        # ===== FONDO CON IMAGEN =====
-        try:
-            bg = pygame.image.load("imagenes/victoryscreen.jpg").convert()
-            bg = pygame.transform.scale(bg, (WIDTH, HEIGHT))
-            surf.blit(bg, (0, 0))
-        except:
-            surf.fill((5, 5, 30))
-
-        # Oscurecido cinematográfico
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        surf.blit(overlay, (0, 0))
 
+    def build_frame(self):
+        """
+        Compone UNA sola vez todo lo estático de la pantalla:
+        fondo, oscurecido, título, texto narrativo y opciones.
+        El resultado queda en ASSETS (ver draw)
+        """
         # Fuentes MAS GRANDES y NEGRITA
-        font_title = pygame.font.SysFont("dejavusans", 110, bold=True)  # SE MANTIENE IGUAL
-        font_sub = pygame.font.SysFont("dejavusans", 32, bold=True)     # Bajado
-        font_body = pygame.font.SysFont("dejavusans", 26, bold=True)    # Bajado
-        font_small = pygame.font.SysFont("dejavusans", 22, bold=True)   # Bajado
+        font_title = TITLE_FONT
+        font_body = get_font("dejavusans", 26, bold=True)
+        font_small = get_font("dejavusans", 22, bold=True)
+
+        # ===== FONDO CON IMAGEN + OSCURECIDO CINEMATOGRÁFICO =====
+        frame = composite_background(
+            VICTORY_BACKGROUND, (0, 0, 0, 150), fill=(5, 5, 30)
+        ).copy()
 
         # ===== TÍTULO ÉPICO =====
-        txt = font_title.render("¡VICTORIA!", True, (255, 215, 100))  
-        surf.blit(txt, txt.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 220)))
+        txt = font_title.render("¡VICTORIA!", True, (255, 215, 100))
+        frame.blit(txt, txt.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 220)))
 
         # ===== TEXTO NARRATIVO =====
         texto = [
             "El ciclo de los mitos ha sido roto.",
             "El Luisón yace derrotado en lo profundo del monte.",
-            "Pero su leyenda permanecerá… en tu nombre."
+            "Pero su leyenda permanecerá… en tu nombre.",
         ]
 
         y = HEIGHT // 2 - 80
         for linea in texto:
             line = font_body.render(linea, True, (240, 240, 240))
-            surf.blit(line, line.get_rect(center=(WIDTH // 2, y)))
+            frame.blit(line, line.get_rect(center=(WIDTH // 2, y)))
             y += 38
 
-        # ===== PUNTAJE FINAL =====
-        puntos = font_sub.render(f"PUNTAJE FINAL: {self.GAME.score}", True, (255, 255, 255))
-        surf.blit(puntos, puntos.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 50)))
-
         # ===== OPCIONES =====
         op1 = font_small.render("Presiona R para Reiniciar", True, (230, 230, 230))
-        surf.blit(op1, op1.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 120)))
+        frame.blit(op1, op1.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 120)))
+
+        op2 = font_small.render(
+            "Presiona ESC para Volver al Inicio", True, (230, 230, 230)
+        )
+        frame.blit(op2, op2.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 155)))
+
+        return frame
+
+    def draw(self, surf, alpha=1.0):
+        surf.blit(composite(("victory",), self.build_frame), (0, 0))
 
-        op2 = font_small.render("Presiona ESC para Volver al Inicio", True, (230, 230, 230))
-        surf.blit(op2, op2.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 155)))
+        # ===== PUNTAJE FINAL (solo se re-renderiza si cambia) =====
+        if self.score_value != self.GAME.score:
+            self.score_value = self.GAME.score
+            self.score_surf = self.font_sub.render(
+                f"PUNTAJE FINAL: {self.score_value}", True, (255, 255, 255)
+            )
+            self.score_rect = self.score_surf.get_rect(
+                center=(WIDTH // 2, HEIGHT // 2 + 50)
+            )
+        surf.blit(self.score_surf, self.score_rect)
 
 
+# ==================== FORMATO DE LOS NIVELES ====================
+"""
+Cada nivel es un archivo niveles/<id>.json. Para agregar un nivel basta
+con crear el JSON y apuntar el "next" del nivel anterior a su id.
 
+- next: id del siguiente nivel, o "victory" para la pantalla final
+- clear_bonus: puntos extra al pasar de nivel con ENTER
+- victory_delay: segundos hasta avanzar solo tras ganar (null = esperar ENTER)
+- background / bg_color: imagen de fondo y color si no se puede cargar
+- music / music_volume: música del nivel
+- player_min_y: límite superior del jugador (null = sin límite)
+- score_per_hit: puntos por cada golpe que acierta
+- intro: title, lines y overlay_alpha de la introducción
+- defeat: text y size del mensaje de derrota (centrado)
+- victory: text, size e y (desde el centro) del mensaje de victoria;
+  hint_size y hint_y del "ENTER para continuar"
+- enemies / boss:
+    name, hp, speed, w, h, hitbox [offset_x, offset_y, reduce_w, reduce_h]
+    frames: folder, count, size [w, h] y speed (segundos por frame)
+    min_y: límite superior (null = sin límite)
+    contact_dps: daño por segundo al tocar al jugador
+    bar: max_hp y color de la barra de vida (enemies también offset_y)
+    enemies: count y spawn {"x": [min, max], "y": [min, max]}; con
+             "x_step" se colocan en fila desde x[0]
+    boss: label (nombre en la barra), x, y
+"""
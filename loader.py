@@ -0,0 +1,221 @@
+import time
+import pygame
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from config import ASSET_LOADER_WORKERS, LOADER_POLL_BUDGET_MS
+from assets import ASSETS
+
+# Un pedido de carga. kind es "image", "sound" o "music";
+# size y mode solo se usan en las imágenes (como en ASSETS.load_image)
+AssetRequest = namedtuple("AssetRequest", "kind path size mode")
+
+
+def image_request(path, size=None, mode="alpha"):
+    return AssetRequest("image", path, tuple(size) if size else None, mode)
+
+
+def sound_request(path):
+    return AssetRequest("sound", path, None, None)
+
+
+def music_request(path):
+    # La música se reproduce en streaming desde el archivo: "cargarla" es
+    # leerlo una vez para que el sistema operativo lo tenga en memoria
+    return AssetRequest("music", path, None, None)
+
+
+# ==================== SONIDOS Y MÚSICA ====================
+_SOUNDS = {}  # ruta -> pygame.mixer.Sound
+_MUSIC_READ = set()  # Archivos de música ya leídos una vez
+
+
+def load_sound(path):
+    """
+    Sonido cargado una sola vez por proceso (compartido: no modificarlo).
+    Lanza las mismas excepciones que pygame.mixer.Sound, así que los
+    try/except existentes siguen funcionando.
+    """
+    sound = _SOUNDS.get(path)
+    if sound is None:
+        sound = pygame.mixer.Sound(path)
+        _SOUNDS[path] = sound
+    return sound
+
+
+# ==================== LOTE DE CARGA ====================
+class LoadBatch:
+    """
+    Un grupo de pedidos que se cargan juntos (por ejemplo todo un nivel).
+
+    - futures: un concurrent.futures.Future por pedido que hubo que cargar
+    - progress(): fracción terminada (0 a 1), para barras de progreso
+    - on_progress(lote) se llama después de cada pedido terminado y
+      on_done(lote) una vez al final; SIEMPRE desde el hilo principal
+      (dentro de AssetLoader.poll), así que pueden tocar pantallas
+    """
+
+    def __init__(self, total, on_progress=None, on_done=None):
+        self.total = total
+        self.completed = 0
+        self.futures = []
+        self.errors = []  # (pedido, excepción) de lo que no se pudo cargar
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.cancelled = False
+
+    def progress(self):
+        return self.completed / self.total if self.total else 1.0
+
+    def done(self):
+        return self.completed >= self.total
+
+
+# ==================== CARGADOR ASÍNCRONO ====================
+class AssetLoader:
+    """
+    Carga imágenes, sonidos y música en un pool de hilos sin frenar el loop.
+
+    Los hilos solo hacen lo que no toca la pantalla: decodificar y escalar
+    imágenes (o leerlas del caché en disco, ver SurfaceCache.decode),
+    decodificar sonidos y leer archivos de música. convert/convert_alpha
+    y guardar en los cachés lo hace poll() en el hilo principal, con un
+    presupuesto de tiempo por frame para no causar tirones.
+
+    Lo que ya está en memoria no se vuelve a pedir, y un pedido que ya se
+    está cargando para otro lote se comparte (un solo future).
+    """
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.executor = None  # El pool se crea con el primer pedido
+        self.pending = []  # (lote, pedido, future) por terminar
+        self.batches = []  # Lotes que todavía no avisaron on_done
+        self.inflight = {}  # pedido -> future en curso
+
+    def load(self, requests, on_progress=None, on_done=None):
+        """Empieza a cargar los pedidos; devuelve el LoadBatch"""
+        todo = [
+            request for request in dict.fromkeys(requests) if not self.ready(request)
+        ]
+        batch = LoadBatch(len(todo), on_progress, on_done)
+
+        for request in todo:
+            future = self.inflight.get(request)
+            if future is None or future.cancelled():
+                if self.executor is None:
+                    self.executor = ThreadPoolExecutor(
+                        self.workers, thread_name_prefix="assets"
+                    )
+                future = self.executor.submit(self.work, request)
+                self.inflight[request] = future
+            batch.futures.append(future)
+            self.pending.append((batch, request, future))
+
+        self.batches.append(batch)
+        return batch
+
+    @staticmethod
+    def ready(request):
+        """True si el pedido ya está en memoria"""
+        if request.kind == "image":
+            key = ASSETS.key(request.path, request.size, request.mode)
+            return ASSETS.get(key) is not None
+        if request.kind == "sound":
+            return request.path in _SOUNDS
+        return request.path in _MUSIC_READ
+
+    @staticmethod
+    def work(request):
+        """En un hilo del pool: la parte lenta de la carga"""
+        if request.kind == "image":
+            return ASSETS.decode(request.path, request.size)
+        if request.kind == "sound":
+            if not pygame.mixer.get_init():
+                return None
+            return pygame.mixer.Sound(request.path)
+
+        with open(request.path, "rb") as f:
+            while f.read(1 << 20):
+                pass
+        return None
+
+    def finish(self, request, result):
+        """En el hilo principal: convertir y guardar en los cachés"""
+        if request.kind == "music":
+            _MUSIC_READ.add(request.path)
+        if self.ready(request) or result is None:
+            return
+        if request.kind == "image":
+            key = ASSETS.key(request.path, request.size, request.mode)
+            ASSETS.put(key, ASSETS.convert(result, request.mode))
+            if request.mode == "alpha":
+                # Los sprites también se dibujan espejados
+                ASSETS.load_image(request.path, request.size, request.mode, flip=True)
+        elif request.kind == "sound":
+            _SOUNDS[request.path] = result
+
+    def poll(self, budget_ms=LOADER_POLL_BUDGET_MS):
+        """
+        En el hilo principal (una vez por frame): termina lo que los hilos
+        ya cargaron y llama a los callbacks. budget_ms limita el tiempo
+        usado; None termina todo lo que esté listo.
+        """
+        start = time.perf_counter()
+        # Los callbacks pueden pedir nuevas cargas mientras se recorre
+        pending, self.pending = self.pending, []
+        waiting = []
+        for entry in pending:
+            batch, request, future = entry
+            over = (
+                budget_ms is not None
+                and (time.perf_counter() - start) * 1000.0 >= budget_ms
+            )
+            if over or not future.done():
+                waiting.append(entry)
+                continue
+
+            if self.inflight.get(request) is future:
+                del self.inflight[request]
+            if not future.cancelled():
+                try:
+                    self.finish(request, future.result())
+                except FileNotFoundError as e:
+                    # Frames opcionales: load_frames también los omite
+                    batch.errors.append((request, e))
+                except Exception as e:
+                    batch.errors.append((request, e))
+                    print(f"⚠ No se pudo cargar {request.path}: {e}")
+
+            batch.completed += 1
+            if batch.on_progress and not batch.cancelled:
+                batch.on_progress(batch)
+        self.pending = waiting + self.pending
+
+        for batch in [batch for batch in self.batches if batch.done()]:
+            self.batches.remove(batch)
+            if batch.on_done and not batch.cancelled:
+                batch.on_done(batch)
+
+    def cancel(self, batch):
+        """
+        Abandona un lote: no se llaman sus callbacks y se cancelan sus
+        pedidos que todavía no empezaron (salvo los que comparte con otro
+        lote). Lo que ya se cargó igual se guarda en los cachés.
+        """
+        batch.cancelled = True
+        shared = {
+            id(future)
+            for other, _, future in self.pending
+            if other is not batch and not other.cancelled
+        }
+        for future in batch.futures:
+            if id(future) not in shared:
+                future.cancel()
+
+    def busy(self):
+        """True si queda algo por cargar o por terminar"""
+        return bool(self.pending)
+
+
+# Instancia global del cargador
+LOADER = AssetLoader(ASSET_LOADER_WORKERS)
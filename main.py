@@ -1,8 +1,12 @@
 import pygame
 import sys
-from config import screen, clock, FPS
-from pages import CoverScreen, SurvivalTipsScreen
+from config import bootstrap, clock, FPS, TICK_RATE, MAX_CATCH_UP_STEPS, IDLE_WAIT_MS
+from config import DIRTY_RECTS, DIRTY_RECT_MAX_FRACTION
+from pages import CoverScreen, LoadingScreen, SurvivalTipsScreen, menu_requests
 from joystickmanager import JOYSTICK, joystick_to_keyboard_event
+from profiler import PROFILER
+from assets import invalidate_composites
+from loader import LOADER
 
 
 # ==================== GESTOR DE PANTALLAS ====================
@@ -19,9 +23,13 @@ class ScreenManager:
         """
         Añade una nueva pantalla a la pila
         La nueva pantalla se convierte en la activa
-        Ejemplo: push(Level1Screen) muestra el nivel 1
+        Ejemplo: push(LevelScreen(manager, "level1")) muestra el nivel 1
         """
+        cur = self.current()
+        if cur:
+            cur.on_exit()
         self.screens.append(screen)
+        self.enter(screen)
 
     def pop(self):
         """
@@ -30,7 +38,48 @@ class ScreenManager:
         Ejemplo: cuando presionas ESC en un nivel, haces pop() para volver al menú
         """
         if self.screens:
-            self.screens.pop()
+            self._remove_top()
+            cur = self.current()
+            if cur:
+                self.enter(cur)
+
+    def replace(self, screen):
+        """
+        Reemplaza la pantalla actual por otra (la pila no crece)
+        Ejemplo: al ganar un nivel, replace() pasa al siguiente y
+        libera todo lo del nivel anterior
+        """
+        if self.screens:
+            self._remove_top()
+        self.screens.append(screen)
+        self.enter(screen)
+
+    def reset_to(self, root=None):
+        """
+        Quita pantallas hasta que root quede arriba (por defecto la primera)
+        Ejemplo: desde VictoryScreen, reset_to() vuelve a la portada
+        """
+        if not self.screens:
+            return
+        if root is None:
+            root = self.screens[0]
+        if root not in self.screens:
+            raise ValueError("La pantalla raíz no está en la pila")
+
+        while self.current() is not root:
+            self._remove_top()
+        self.enter(root)
+
+    def enter(self, screen):
+        """La pantalla pasa a ser la activa: hay que dibujarla de nuevo"""
+        screen.mark_dirty()
+        screen.on_enter()
+
+    def _remove_top(self):
+        """Saca la pantalla de arriba y libera sus recursos"""
+        screen = self.screens.pop()
+        screen.on_exit()
+        screen.unload()
 
     def current(self):
         """
@@ -46,6 +95,9 @@ class ScreenManager:
         """
         cur = self.current()
         if cur:
+            # Cualquier input redibuja; el mouse solo si cambia un hover
+            if event.type != pygame.MOUSEMOTION:
+                cur.mark_dirty()
             cur.handle_event(event)
 
     def update(self, dt):
@@ -58,49 +110,127 @@ class ScreenManager:
         if cur:
             cur.update(dt)
 
-    def draw(self, surf):
+    def draw(self, surf, alpha=1.0, partial=DIRTY_RECTS):
         """
         Dibuja la pantalla actual en la superficie proporcionada
         surf = surface (la ventana del juego)
+        alpha = fracción (0-1) del próximo paso de simulación ya transcurrida,
+        para interpolar posiciones entre el paso anterior y el actual
+        partial = si se permite redibujar solo las zonas sucias
         Aquí se dibujan todos los elementos visuales
+
+        Retorna la lista de zonas redibujadas (para pygame.display.update)
+        o None si se redibujó toda la pantalla (hay que hacer flip)
         """
         cur = self.current()
-        if cur:
-            cur.draw(surf)
+        if not cur:
+            return None
+
+        area = self.partial_area(cur, surf) if partial else None
+        if area is None:
+            cur.draw(surf, alpha)
+        elif area:
+            # La pantalla se dibuja UNA vez recortada a la unión de las
+            # zonas: los blits fuera del recorte no tocan píxeles
+            surf.set_clip(area[0])
+            cur.draw(surf, alpha)
+            surf.set_clip(None)
+
+        cur.dirty = False
+        cur.dirty_area = None
+        return area
+
+    @staticmethod
+    def partial_area(cur, surf):
+        """
+        Zona a redibujar (como lista de un rect: la unión de las zonas
+        sucias) si conviene un redibujo parcial, o None si hay que
+        redibujar todo (pantalla no quieta, toda sucia, o la unión supera
+        DIRTY_RECT_MAX_FRACTION de la ventana)
+        """
+        if not cur.wants_idle() or not cur.dirty or cur.dirty_area is None:
+            return None
+
+        bounds = surf.get_rect()
+        area = [rect.clip(bounds) for rect in cur.dirty_area]
+        area = [rect for rect in area if rect.width and rect.height]
+        if not area:
+            return []
+        union = area[0].unionall(area[1:])
+        if union.width * union.height > DIRTY_RECT_MAX_FRACTION * (
+            bounds.width * bounds.height
+        ):
+            return None
+        return [union]
+
+    def needs_draw(self):
+        """
+        False si la pantalla actual está quieta y no cambió desde el último
+        dibujo: no hace falta redibujarla ni hacer flip
+        """
+        cur = self.current()
+        return cur is None or not cur.wants_idle() or cur.dirty
 
 
 # ==================== INICIALIZACIÓN ====================
 # Crea el gestor de pantallas (una sola instancia para todo el juego)
 manager = ScreenManager()
 
-# Añade la pantalla de portada como primera pantalla
-# Esta será la pantalla que se muestra al iniciar el juego
-manager.push(CoverScreen(manager))
-
 
 # ==================== FUNCIÓN PRINCIPAL ====================
-def main():
+def main(headless=False):
     """
     Función principal del juego - El game loop (bucle principal)
     Se ejecuta continuamente mientras el juego está corriendo
+
+    headless=True corre sin ventana ni audio (drivers "dummy" de SDL)
     """
+    # Abre la ventana, el audio y el mando
+    screen = bootstrap(headless)
+
+    # Añade la pantalla de portada como primera pantalla
+    # Esta será la pantalla que se muestra al iniciar el juego; antes se
+    # cargan en segundo plano los recursos de los menús y del jugador
+    manager.push(LoadingScreen(manager, menu_requests(), CoverScreen))
 
     # Variable para controlar el estado de pantalla completa
     fullscreen = False
 
+    # Paso fijo de simulación: la lógica siempre avanza de a `step` segundos,
+    # sin importar cuánto tarde cada frame en dibujarse
+    step = 1.0 / TICK_RATE
+    accumulator = 0.0
+
     # BUCLE PRINCIPAL DEL JUEGO (se repite ~60 veces por segundo)
     while True:
+        # El perfilador mide cada fase del frame (F3 muestra los tiempos)
+        t = PROFILER.begin_frame(manager.current())
+
         # ===== ACTUALIZAR JOYSTICK =====
         JOYSTICK.update()
+        PROFILER.mark("joystick", t)
 
         # ===== CONTROL DE TIEMPO =====
         # clock.tick(FPS) limita el juego a 60 FPS y devuelve milisegundos transcurridos
         # Dividimos entre 1000 para convertir a segundos (dt = delta time)
-        dt = clock.tick(FPS) / 1000.0
+        # Las esperas (tick o event.wait) no cuentan como tiempo de ninguna fase
+        if manager.needs_draw():
+            dt = clock.tick(FPS) / 1000.0
+            events = pygame.event.get()
+        else:
+            # Pantalla quieta: dormir hasta que llegue un evento o pasen
+            # IDLE_WAIT_MS (para que sigan corriendo timers como el cursor)
+            first = pygame.event.wait(IDLE_WAIT_MS)
+            events = pygame.event.get()
+            if first.type != pygame.NOEVENT:
+                events.insert(0, first)
+            dt = clock.tick() / 1000.0
+        accumulator += dt
+        t = PROFILER.now()
 
         # ===== MANEJO DE EVENTOS =====
         # Procesa todos los eventos que ocurrieron (clicks, teclas, etc.)
-        for event in pygame.event.get():
+        for event in events:
 
             # Si el usuario cierra la ventana (X)
             if event.type == pygame.QUIT:
@@ -115,11 +245,18 @@ def main():
                 if event.key == pygame.K_F11:
                     fullscreen = not fullscreen
                     if fullscreen:
-                        pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+                        screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
                     else:
                         from config import WIDTH, HEIGHT
 
-                        pygame.display.set_mode((WIDTH, HEIGHT))
+                        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+
+                    # Los fondos compuestos dependen del formato de pantalla
+                    invalidate_composites()
+
+                # F3: Muestra u oculta el perfilador
+                if event.key == pygame.K_F3:
+                    PROFILER.toggle()
 
             # Pasa el evento a la pantalla actual
             manager.handle_event(event)
@@ -130,19 +267,51 @@ def main():
                 # Simular que se presionó una tecla
                 manager.handle_event(keyboard_event)
 
+        t = PROFILER.mark("events", t)
+
         # ===== ACTUALIZACIÓN =====
         # Actualiza la lógica del juego (movimientos, colisiones, animaciones)
-        manager.update(dt)
+        # en pasos fijos. Tras un tirón (p. ej. construir un nivel) se
+        # recuperan como mucho MAX_CATCH_UP_STEPS pasos y el resto se descarta,
+        # así los enemigos no se teletransportan ni el daño llega de golpe
+        accumulator = min(accumulator, MAX_CATCH_UP_STEPS * step)
+        # Terminar en el hilo principal lo que el cargador asíncrono ya
+        # tiene listo (precargas), con un presupuesto de tiempo por frame
+        LOADER.poll()
+        while accumulator >= step:
+            manager.update(step)
+            accumulator -= step
+        t = PROFILER.mark("update", t)
+
+        # Pantalla quieta sin cambios: lo que se ve ya está bien
+        # (con el perfilador abierto se redibuja igual para actualizarlo)
+        if not manager.needs_draw() and not PROFILER.visible:
+            PROFILER.skip_frame()
+            continue
 
         # ===== RENDERIZADO =====
-        # Dibuja todo en la pantalla
-        manager.draw(screen)
+        # Dibuja todo en la pantalla, interpolando entre los dos últimos pasos
+        # Con el perfilador abierto se dibuja todo (el overlay cambia siempre)
+        area = manager.draw(
+            screen, accumulator / step, partial=DIRTY_RECTS and not PROFILER.visible
+        )
+        PROFILER.mark("draw", t)
+
+        # El overlay del perfilador no se cuenta dentro de "draw"
+        PROFILER.draw_overlay(screen, dt)
 
         # ===== ACTUALIZACIÓN DE PANTALLA =====
-        # Muestra lo que acabamos de dibujar
-        pygame.display.flip()
+        # Muestra lo que acabamos de dibujar: toda la ventana o solo las
+        # zonas que se redibujaron
+        t = PROFILER.now()
+        if area is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(area)
+        PROFILER.mark("flip", t)
+        PROFILER.end_frame()
 
 
 # ==================== PUNTO DE ENTRADA ====================
 if __name__ == "__main__":
-    main()
+    main(headless="--headless" in sys.argv)
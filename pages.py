@@ -1,12 +1,45 @@
 import pygame
 import random
-from config import WIDTH, HEIGHT, draw_text
-from player import Player
+from config import WIDTH, HEIGHT, HUD_FONT, draw_text, draw_text_fast, stop_music
+from fonts import get_font, render_text, render_text_alpha
+from assets import composite_background
+from loader import LOADER, image_request, music_request
+from player import Player, player_requests
 from base import ScreenBase
 from game_state import GAME
 
+# ==================== RECURSOS DE LOS MENÚS ====================
+COVER_BACKGROUND = "imagenes/portada.png"
+CUSTOMIZE_BACKGROUND = "imagenes/page_personalizacion.jpg"
+TIPS_BACKGROUND = "imagenes/fondo_control.jpg"
+INTRO_BACKGROUND = "imagenes/fondo_intro.jpg"
+MENU_MUSIC = "sonidos/audio_srpombero.mp3"
+
+
+def menu_requests():
+    """
+    Pedidos de carga (ver loader.py) de los menús y del jugador, que se
+    crea en la pantalla de personalización: se cargan antes de la portada
+    """
+    backgrounds = (
+        COVER_BACKGROUND,
+        CUSTOMIZE_BACKGROUND,
+        TIPS_BACKGROUND,
+        INTRO_BACKGROUND,
+    )
+    requests = [image_request(path, (WIDTH, HEIGHT), "opaque") for path in backgrounds]
+    return requests + [music_request(MENU_MUSIC)] + player_requests()
+
 
 # ==================== CLASE BOTÓN ====================
+# Margen alrededor del botón que ocupa la sombra
+BUTTON_SHADOW = 4
+
+# Botones ya dibujados: (texto, color, tamaño, hover) -> superficie.
+# Los botones iguales de distintas pantallas comparten la superficie
+_BUTTON_SURFACES = {}
+
+
 class Button:
     def __init__(self, rect, text, color=(80, 100, 160)):
         self.rect = pygame.Rect(rect)
@@ -14,49 +47,88 @@ class Button:
         self.color = color
         self.hover = False
 
-    def draw(self, surf):
-        btn_color = (
-            tuple(min(255, c + 40) for c in self.color) if self.hover else self.color
-        )
-
-        gradient = pygame.Surface(self.rect.size)
-        for y in range(self.rect.height):
-            factor = y / self.rect.height
+        # Superficies (normal, hover) y el aspecto con el que se hicieron
+        self.baked = None
+        self.baked_key = None
+
+    @staticmethod
+    def bake(text, color, size, hover):
+        """
+        Dibuja una vez el botón completo (degradado, borde, sombra y texto)
+        en una superficie con transparencia, con BUTTON_SHADOW px de margen
+        para la sombra
+        """
+        key = (text, color, size, hover)
+        surface = _BUTTON_SURFACES.get(key)
+        if surface is not None:
+            return surface
+
+        width, height = size
+        btn_color = tuple(min(255, c + 40) for c in color) if hover else color
+
+        gradient = pygame.Surface(size)
+        for y in range(height):
+            factor = y / height
             r = int(btn_color[0] * (0.7 + 0.3 * factor))
             g = int(btn_color[1] * (0.7 + 0.3 * factor))
             b = int(btn_color[2] * (0.8 + 0.2 * factor))
-            pygame.draw.line(gradient, (r, g, b), (0, y), (self.rect.width, y))
-        surf.blit(gradient, self.rect.topleft)
+            pygame.draw.line(gradient, (r, g, b), (0, y), (width, y))
 
-        pygame.draw.rect(surf, (180, 200, 255), self.rect, 3, border_radius=12)
+        m = BUTTON_SHADOW
+        surface = pygame.Surface((width + 2 * m, height + 2 * m), pygame.SRCALPHA)
+        body = pygame.Rect(m, m, width, height)
+        surface.blit(gradient, body.topleft)
+        pygame.draw.rect(surface, (180, 200, 255), body, 3, border_radius=12)
 
-        shadow = pygame.Surface(
-            (self.rect.width + 8, self.rect.height + 8), pygame.SRCALPHA
-        )
+        shadow = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
         pygame.draw.rect(shadow, (0, 0, 0, 90), shadow.get_rect(), border_radius=14)
-        surf.blit(shadow, (self.rect.x - 4, self.rect.y - 4))
+        surface.blit(shadow, (0, 0))
 
         draw_text(
-            surf,
-            self.text,
+            surface,
+            text,
             26,
-            self.rect.centerx + 2,
-            self.rect.centery + 2,
+            body.centerx + 2,
+            body.centery + 2,
             color=(0, 0, 0),
             center=True,
         )
         draw_text(
-            surf,
-            self.text,
+            surface,
+            text,
             26,
-            self.rect.centerx,
-            self.rect.centery,
+            body.centerx,
+            body.centery,
             color=(240, 240, 255),
             center=True,
         )
 
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        _BUTTON_SURFACES[key] = surface
+        return surface
+
+    def draw(self, surf):
+        # Solo se vuelve a hornear si cambió el texto, el color o el tamaño
+        # (reasignar los mismos valores en cada frame no cuesta nada)
+        key = (self.text, tuple(self.color), self.rect.size)
+        if key != self.baked_key:
+            self.baked_key = key
+            self.baked = (self.bake(*key, False), self.bake(*key, True))
+
+        image = self.baked[1] if self.hover else self.baked[0]
+        surf.blit(image, (self.rect.x - BUTTON_SHADOW, self.rect.y - BUTTON_SHADOW))
+
     def update_hover(self, pos):
-        self.hover = self.rect.collidepoint(pos)
+        """Actualiza el hover; devuelve True si cambió (hay que redibujar)"""
+        hover = bool(self.rect.collidepoint(pos))
+        changed = hover != self.hover
+        self.hover = hover
+        return changed
+
+    def dirty_rect(self):
+        """Zona que ocupa el botón en pantalla (incluida la sombra)"""
+        return self.rect.inflate(2 * BUTTON_SHADOW, 2 * BUTTON_SHADOW)
 
     def clicked(self, pos):
         return self.rect.collidepoint(pos)
@@ -73,15 +145,13 @@ class CoverScreen(ScreenBase):
             color=(70, 80, 130),
         )
 
+    def on_enter(self):
+        # La música del menú sigue sonando entre las pantallas del menú;
+        # solo se (re)inicia si un nivel la detuvo
+        if not pygame.mixer.get_init() or pygame.mixer.music.get_busy():
+            return
         try:
-            self.bg_image = pygame.image.load("imagenes/portada.png").convert()
-            self.bg_image = pygame.transform.scale(self.bg_image, (WIDTH, HEIGHT))
-        except:
-            self.bg_image = pygame.Surface((WIDTH, HEIGHT))
-            self.bg_image.fill((20, 20, 40))
-
-        try:
-            pygame.mixer.music.load("sonidos/audio_srpombero.mp3")
+            pygame.mixer.music.load(MENU_MUSIC)
             pygame.mixer.music.set_volume(0.5)
             pygame.mixer.music.play(-1)
         except:
@@ -92,15 +162,19 @@ class CoverScreen(ScreenBase):
             if self.start_btn.clicked(event.pos):
                 self.manager.push(CustomizeScreen(self.manager))
 
-    def update(self, dt):
-        self.start_btn.update_hover(pygame.mouse.get_pos())
+    def wants_idle(self):
+        return True
 
-    def draw(self, surf):
-        surf.blit(self.bg_image, (0, 0))
+    def update(self, dt):
+        if self.start_btn.update_hover(pygame.mouse.get_pos()):
+            self.mark_dirty(self.start_btn.dirty_rect())
 
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        pygame.draw.rect(overlay, (0, 0, 40, 100), (0, 0, WIDTH, HEIGHT))
-        surf.blit(overlay, (0, 0))
+    def draw(self, surf, alpha=1.0):
+        # Fondo con el oscurecido ya aplicado (un solo blit)
+        background = composite_background(
+            COVER_BACKGROUND, (0, 0, 40, 100), fill=(20, 20, 40)
+        )
+        surf.blit(background, (0, 0))
 
         draw_text(
             surf, "PARAGUAYITO", 84, WIDTH // 2 + 3, 142, color=(0, 0, 0), center=True
@@ -157,14 +231,6 @@ class CustomizeScreen(ScreenBase):
         self.cursor_visible = True
         self.cursor_timer = 0
 
-        try:
-            self.bg_image = pygame.image.load(
-                "imagenes/page_personalizacion.jpg"
-            ).convert()
-            self.bg_image = pygame.transform.scale(self.bg_image, (WIDTH, HEIGHT))
-        except:
-            self.bg_image = None
-
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.next_btn.clicked(event.pos):
@@ -189,25 +255,30 @@ class CustomizeScreen(ScreenBase):
             elif len(self.text) < 16 and event.unicode.isprintable():
                 self.text += event.unicode
 
+    def wants_idle(self):
+        return True
+
     def update(self, dt):
         self.cursor_timer += dt
         if self.cursor_timer > 0.5:
             self.cursor_visible = not self.cursor_visible
             self.cursor_timer = 0
+            # El cursor solo se ve al escribir en el campo
+            if self.active and self.text.strip() != "":
+                self.mark_dirty(self.input_rect)
 
         mouse_pos = pygame.mouse.get_pos()
-        self.next_btn.update_hover(mouse_pos)
-        self.back_btn.update_hover(mouse_pos)
-
-    def draw(self, surf):
-        if self.bg_image:
-            surf.blit(self.bg_image, (0, 0))
-        else:
-            surf.fill((15, 15, 30))
-
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 40))
-        surf.blit(overlay, (0, 0))
+        if self.next_btn.update_hover(mouse_pos):
+            self.mark_dirty(self.next_btn.dirty_rect())
+        if self.back_btn.update_hover(mouse_pos):
+            self.mark_dirty(self.back_btn.dirty_rect())
+
+    def draw(self, surf, alpha=1.0):
+        # Fondo con el oscurecido ya aplicado (un solo blit)
+        background = composite_background(
+            CUSTOMIZE_BACKGROUND, (0, 0, 0, 40), fill=(15, 15, 30)
+        )
+        surf.blit(background, (0, 0))
 
         draw_text(
             surf,
@@ -223,13 +294,11 @@ class CustomizeScreen(ScreenBase):
         pygame.draw.rect(surf, (10, 10, 25), self.input_rect, border_radius=10)
         pygame.draw.rect(surf, border_color, self.input_rect, 3, border_radius=10)
 
-        font = pygame.font.SysFont("dejavusans", 26, bold=True)
-
         if self.text.strip() == "":
-            placeholder = font.render("INGRESA TU NOMBRE...", True, (180, 180, 180))
+            placeholder = render_text("INGRESA TU NOMBRE...", HUD_FONT, (180, 180, 180))
             surf.blit(placeholder, (self.input_rect.x + 15, self.input_rect.y + 14))
         else:
-            txt_surface = font.render(self.text.upper(), True, (255, 255, 255))
+            txt_surface = render_text(self.text.upper(), HUD_FONT, (255, 255, 255))
             surf.blit(txt_surface, (self.input_rect.x + 15, self.input_rect.y + 14))
 
             if self.active and self.cursor_visible:
@@ -252,19 +321,14 @@ class CustomizeScreen(ScreenBase):
 class SurvivalTipsScreen(ScreenBase):
     def __init__(self, manager):
         self.manager = manager
+        # ====== BOTONES ESTILO VICTORY ======
         self.next_btn = Button(
-            (WIDTH - 240, HEIGHT - 90, 200, 60), "CONTINUAR", color=(80, 140, 120)
+            (WIDTH - 240, HEIGHT - 90, 200, 60), "CONTINUAR", color=(90, 150, 120)
         )
         self.back_btn = Button(
-            (40, HEIGHT - 90, 200, 60), "VOLVER", color=(120, 80, 90)
+            (40, HEIGHT - 90, 200, 60), "VOLVER", color=(150, 80, 90)
         )
 
-        try:
-            self.bg_image = pygame.image.load("imagenes/fondo_control.jpg").convert()
-            self.bg_image = pygame.transform.scale(self.bg_image, (WIDTH, HEIGHT))
-        except:
-            self.bg_image = None
-
         self.tips = [
             '" No se vayan todo"',
             "By Olaf",
@@ -288,22 +352,22 @@ class SurvivalTipsScreen(ScreenBase):
             if self.back_btn.clicked(event.pos):
                 self.manager.pop()
 
+    def wants_idle(self):
+        return True
+
     def update(self, dt):
         mouse = pygame.mouse.get_pos()
-        self.next_btn.update_hover(mouse)
-        self.back_btn.update_hover(mouse)
-
-    def draw(self, surf):
-        # Fondo
-        if self.bg_image:
-            surf.blit(self.bg_image, (0, 0))
-        else:
-            surf.fill((20, 20, 25))
-
-        # Oscurecer para efecto cinematográfico
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 160))
-        surf.blit(overlay, (0, 0))
+        if self.next_btn.update_hover(mouse):
+            self.mark_dirty(self.next_btn.dirty_rect())
+        if self.back_btn.update_hover(mouse):
+            self.mark_dirty(self.back_btn.dirty_rect())
+
+    def draw(self, surf, alpha=1.0):
+        # Fondo, oscurecido para efecto cinematográfico (un solo blit)
+        background = composite_background(
+            TIPS_BACKGROUND, (0, 0, 0, 160), fill=(20, 20, 25)
+        )
+        surf.blit(background, (0, 0))
 
         # ====== TÍTULO ======
         title = "TIPS DE SUPERVIVENCIA"
@@ -330,13 +394,6 @@ class SurvivalTipsScreen(ScreenBase):
             draw_text(surf, c, 20, WIDTH // 2, y, center=True, color=(210, 225, 255))
             y += 42
 
-        # ====== BOTONES ESTILO VICTORY ======
-        self.back_btn.text = "VOLVER"
-        self.back_btn.color = (150, 80, 90)
-
-        self.next_btn.text = "CONTINUAR"
-        self.next_btn.color = (90, 150, 120)
-
         self.back_btn.draw(surf)
         self.next_btn.draw(surf)
 
@@ -363,40 +420,47 @@ class IntroScreen(ScreenBase):
         ]
         self.controls = ["WASD o FLECHAS: Movimiento", "ESPACIO: Atacar", "ESC: Menú"]
         self.text_alpha = 0
-
-        try:
-            self.bg_image = pygame.image.load("imagenes/fondo_intro.jpg").convert()
-            self.bg_image = pygame.transform.scale(self.bg_image, (WIDTH, HEIGHT))
-        except:
-            self.bg_image = None
         # Detener la música aquí
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.cont_btn.clicked(event.pos):
-                pygame.mixer.music.stop()
-                from level1 import Level1Screen
+                stop_music()
+                from level import build_screen, screen_requests
 
-                self.manager.push(Level1Screen(self.manager))
+                # El nivel se carga en segundo plano con la pantalla de carga
+                self.manager.push(
+                    LoadingScreen(
+                        self.manager,
+                        screen_requests("level1"),
+                        lambda manager: build_screen(manager, "level1"),
+                    )
+                )
 
             if self.back_btn.clicked(event.pos):
                 self.manager.pop()
 
-    def update(self, dt):
-        self.text_alpha = min(255, self.text_alpha + dt * 150)
-        mouse_pos = pygame.mouse.get_pos()
-        self.cont_btn.update_hover(mouse_pos)
-        self.back_btn.update_hover(mouse_pos)
+    def wants_idle(self):
+        # Quieta recién cuando termina el fundido del texto
+        return self.text_alpha >= 255
 
-    def draw(self, surf):
-        if self.bg_image:
-            surf.blit(self.bg_image, (0, 0))
-        else:
-            surf.fill((20, 18, 32))
+    def update(self, dt):
+        if self.text_alpha < 255:
+            self.text_alpha = min(255, self.text_alpha + dt * 150)
+            self.mark_dirty()
 
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 80))
-        surf.blit(overlay, (0, 0))
+        mouse_pos = pygame.mouse.get_pos()
+        if self.cont_btn.update_hover(mouse_pos):
+            self.mark_dirty(self.cont_btn.dirty_rect())
+        if self.back_btn.update_hover(mouse_pos):
+            self.mark_dirty(self.back_btn.dirty_rect())
+
+    def draw(self, surf, alpha=1.0):
+        # Fondo con el oscurecido ya aplicado (un solo blit)
+        background = composite_background(
+            INTRO_BACKGROUND, (0, 0, 0, 80), fill=(20, 18, 32)
+        )
+        surf.blit(background, (0, 0))
 
         draw_text(
             surf, "LA LEYENDA", 58, WIDTH // 2, 100, color=(240, 230, 255), center=True
@@ -406,12 +470,91 @@ class IntroScreen(ScreenBase):
         for i, line in enumerate(self.lines):
             line_alpha = max(0, min(255, self.text_alpha - i * 20))
             if line_alpha > 0:
-                txt = pygame.font.SysFont("dejavusans", 28, bold=True).render(
-                    line, True, (245, 245, 250)
+                txt = render_text_alpha(
+                    line,
+                    get_font("dejavusans", 28, bold=True),
+                    (245, 245, 250),
+                    line_alpha,
                 )
-                txt.set_alpha(line_alpha)
                 surf.blit(txt, txt.get_rect(center=(WIDTH // 2, y)))
             y += 38
 
         self.back_btn.draw(surf)
         self.cont_btn.draw(surf)
+
+
+# ==================== PANTALLA DE CARGA ====================
+class LoadingScreen(ScreenBase):
+    """
+    Pantalla genérica de carga: pide los recursos al cargador asíncrono
+    (ver loader.py) y, cuando están todos, se reemplaza por la pantalla
+    que devuelve build(manager). Mientras tanto el loop sigue corriendo:
+    los eventos se procesan y la barra de progreso se dibuja a 60 FPS.
+
+    Si la carga termina antes de LOADING_SCREEN_DELAY no se dibuja nada
+    (evita un parpadeo cuando todo ya estaba en memoria).
+    """
+
+    LOADING_SCREEN_DELAY = 0.15
+    POLL_BUDGET_MS = 8  # Más presupuesto que en juego: no hay nada que simular
+
+    BAR_WIDTH = 400
+    BAR_HEIGHT = 18
+
+    def __init__(self, manager, requests, build, title="CARGANDO"):
+        self.manager = manager
+        self.requests = list(requests)
+        self.build = build  # función(manager) -> pantalla ya cargada
+        self.title = title
+        self.batch = None
+        self.elapsed = 0.0
+
+    def on_enter(self):
+        if self.batch is None:
+            self.batch = LOADER.load(self.requests)
+
+    def unload(self):
+        # Si se sale antes de terminar, lo pendiente ya no hace falta
+        if self.batch is not None and not self.batch.done():
+            LOADER.cancel(self.batch)
+        self.batch = None
+
+    def update(self, dt):
+        self.elapsed += dt
+        LOADER.poll(budget_ms=self.POLL_BUDGET_MS)
+        if self.batch is not None and self.batch.done():
+            self.manager.replace(self.build(self.manager))
+
+    def draw(self, surf, alpha=1.0):
+        if self.elapsed < self.LOADING_SCREEN_DELAY:
+            return
+
+        surf.fill((20, 18, 32))
+        dots = "." * (int(self.elapsed * 3) % 4)
+        draw_text(
+            surf,
+            f"{self.title}{dots}",
+            48,
+            WIDTH // 2 - 120,
+            HEIGHT // 2 - 80,
+            color=(240, 230, 255),
+        )
+
+        progress = self.batch.progress() if self.batch is not None else 0.0
+        bar = pygame.Rect(0, 0, self.BAR_WIDTH, self.BAR_HEIGHT)
+        bar.center = (WIDTH // 2, HEIGHT // 2)
+        pygame.draw.rect(surf, (50, 45, 70), bar)
+        fill = bar.copy()
+        fill.width = int(self.BAR_WIDTH * progress)
+        pygame.draw.rect(surf, (255, 215, 0), fill)
+        pygame.draw.rect(surf, (240, 230, 255), bar, 2)
+
+        draw_text_fast(
+            surf,
+            f"{int(progress * 100)}%",
+            24,
+            WIDTH // 2,
+            HEIGHT // 2 + 40,
+            color=(240, 230, 255),
+            center=True,
+        )
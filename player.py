@@ -1,12 +1,74 @@
 import pygame
 import math
-from config import WIDTH, HEIGHT
+from config import WIDTH, HEIGHT, MACHETE_ANGLE_STEP, MACHETE_SWING_AMPLITUDE
+from assets import FrameSet, frame_images, load_frames, load_image
+from loader import image_request, load_sound, sound_request
+
+# Sprite principal como (ruta, tamaño)
+PLAYER_IMAGE = ("imagenes/paraguayito.png", (180, 210))
+
+# Animaciones del jugador como (carpeta, cantidad de frames, tamaño);
+# spritepack.py las empaqueta con estos mismos valores
+WALK_ANIMATION = ("imagenes/paraguayito_anim", 4, (180, 210))
+MACHETE_ANIMATION = ("imagenes/machete_anim", 4, (120, 120))
+
+# Efectos de sonido
+SOUND_MACHETE = "sonidos/espada.mp3"
+SOUND_HIT = "sonidos/efecto_golpe.mp3"
+
+
+def player_requests():
+    """Pedidos de carga (ver loader.py) de todo lo que usa Player"""
+    requests = [image_request(*PLAYER_IMAGE)]
+    for animation in (WALK_ANIMATION, MACHETE_ANIMATION):
+        requests += [image_request(*image) for image in frame_images(*animation)]
+    requests += [sound_request(SOUND_MACHETE), sound_request(SOUND_HIT)]
+    return requests
 
 
 class Player:
+    # Sin __dict__: menos memoria y acceso más rápido a atributos.
+    # attack_damage y original_* los agrega el carrulim (ver powerup.py)
+    __slots__ = (
+        "x",
+        "y",
+        "prev_x",
+        "prev_y",
+        "speed",
+        "health",
+        "facing",
+        "attacking",
+        "attack_timer",
+        "attack_duration",
+        "attack_damage",
+        "original_speed",
+        "original_attack_damage",
+        "image",
+        "image_flipped",
+        "w",
+        "h",
+        "body_box",
+        "hurt_box",
+        "attack_box",
+        "walk_frames",
+        "walk_frame",
+        "walk_speed",
+        "walk_timer",
+        "machete_frames",
+        "machete_frame",
+        "machete_speed",
+        "machete_timer",
+        "machete_swing",
+        "sonido_machete",
+        "sonido_golpe",
+    )
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
+        # Posición del paso anterior (para interpolar al dibujar)
+        self.prev_x = x
+        self.prev_y = y
         self.speed = 180
         self.health = 100
 
@@ -19,81 +81,113 @@ class Player:
         self.attack_duration = 0.2
 
         # Sprite principal
-        self.image = pygame.image.load("imagenes/paraguayito.png").convert_alpha()
-        self.image = pygame.transform.scale(self.image, (180, 210))
+        self.image = load_image(*PLAYER_IMAGE)
+        self.image_flipped = load_image(*PLAYER_IMAGE, flip=True)
         self.w = self.image.get_width()
         self.h = self.image.get_height()
 
+        # Cajas de colisión: Rects propios que se mueven en el lugar
+        self.body_box = pygame.Rect(0, 0, self.w, self.h)
+        self.hurt_box = pygame.Rect(0, 0, self.w - 140, self.h - 80)
+        self.attack_box = pygame.Rect(0, 0, 50, 50)
+
         # ===== ANIMACIÓN DE CAMINAR (4 FRAMES) =====
-        self.walk_frames = []
-        for i in range(1, 5):
-
-            try:
-                img = pygame.image.load(
-                    f"imagenes/paraguayito_anim/frame{i}.png"
-                ).convert_alpha()
-                img = pygame.transform.scale(img, (180, 210))
-                self.walk_frames.append(img)
-            except:
-                break
+        # Ambas orientaciones precalculadas (ver assets.FrameSet)
+        self.walk_frames = load_frames(*WALK_ANIMATION)
 
         self.walk_frame = 0
         self.walk_speed = 0.10
         self.walk_timer = 0
 
         # ===== ANIMACIÓN DEL MACHETE =====
-        self.machete_frames = []
-        for i in range(1, 5):
-            try:
-                img = pygame.image.load(
-                    f"imagenes/machete_anim/frame{i}.png"
-                ).convert_alpha()
-                img = pygame.transform.scale(img, (120, 120))
-                self.machete_frames.append(img)
-            except:
-                break
+        self.machete_frames = load_frames(*MACHETE_ANIMATION)
 
         if len(self.machete_frames) == 0:
-            self.machete_frames = [pygame.Surface((0, 0), pygame.SRCALPHA)]
+            empty = pygame.Surface((0, 0), pygame.SRCALPHA)
+            self.machete_frames = FrameSet([empty], [empty])
 
         self.machete_frame = 0
         self.machete_speed = 0.04
         self.machete_timer = 0
 
+        # Giros del machete ya rotados (ver build_machete_swing)
+        self.machete_swing = self.build_machete_swing()
+
         # ==== SONIDOS ====
         try:
-            self.sonido_machete = pygame.mixer.Sound("sonidos/espada.mp3")
+            self.sonido_machete = load_sound(SOUND_MACHETE)
         except:
             self.sonido_machete = None
 
         try:
-            self.sonido_golpe = pygame.mixer.Sound("sonidos/efecto_golpe.mp3")
+            self.sonido_golpe = load_sound(SOUND_HIT)
         except:
             self.sonido_golpe = None
 
+    def build_machete_swing(self):
+        """
+        Precalcula el machete rotado para cada frame, orientación y ángulo
+        cuantizado a MACHETE_ANGLE_STEP grados. Durante el ataque draw()
+        solo busca en esta tabla: nunca llama a pygame.transform.rotate.
+
+        Retorna: {(frame, espejado): {ángulo: superficie}}
+        """
+        step = MACHETE_ANGLE_STEP
+        max_angle = math.ceil(MACHETE_SWING_AMPLITUDE / step) * step
+
+        swing = {}
+        for i in range(len(self.machete_frames)):
+            for flip in (False, True):
+                base = self.machete_frames.get(i, flip)
+                table = {}
+                for angle in range(-max_angle, max_angle + 1, step):
+                    table[angle] = (
+                        pygame.transform.rotate(base, angle) if angle else base
+                    )
+                swing[(i, flip)] = table
+        return swing
+
+    # Las tres cajas devuelven SIEMPRE el mismo Rect actualizado en el lugar
+    # (no se crea uno por llamada): no guardarlas esperando que no cambien.
+    # int() trunca igual que pygame.Rect(x, y, ...).
     def rect(self):
-        return pygame.Rect(self.x, self.y, self.w, self.h)
+        r = self.body_box
+        r.x = int(self.x)
+        r.y = int(self.y)
+        return r
 
     def hurt_rect(self):
-        return pygame.Rect(self.x + 70, self.y + 40, self.w - 140, self.h - 80)
+        r = self.hurt_box
+        r.x = int(self.x + 70)
+        r.y = int(self.y + 40)
+        return r
 
     def attack_rect(self):
         offset_y = 80
         offset_x = 120
-        w = 50
-        h = 50
 
+        r = self.attack_box
         if self.facing == 1:
-            x = self.x + offset_x
+            r.x = int(self.x + offset_x)
         else:
-            x = self.x + self.w - offset_x - w
+            r.x = int(self.x + self.w - offset_x - r.width)
+
+        r.y = int(self.y + offset_y)
+        return r
 
-        y = self.y + offset_y
-        return pygame.Rect(x, y, w, h)
+    def lerp_pos(self, alpha):
+        """Posición interpolada entre el paso anterior y el actual"""
+        return (
+            self.prev_x + (self.x - self.prev_x) * alpha,
+            self.prev_y + (self.y - self.prev_y) * alpha,
+        )
 
     def update(self, dt, keys):
         from joystickmanager import JOYSTICK
 
+        self.prev_x = self.x
+        self.prev_y = self.y
+
         dx = dy = 0
 
         # ==================== CONTROL TECLADO ====================
@@ -168,40 +262,38 @@ class Player:
             return self.attack_rect()
         return None
 
-    def draw(self, surf):
+    def draw(self, surf, alpha=1.0):
+        x, y = self.lerp_pos(alpha)
 
         # ========= SPRITE DEL JUGADOR (animación caminar) =========
-        if hasattr(self, "walk_frames") and len(self.walk_frames) > 0:
-            sprite = self.walk_frames[self.walk_frame]
+        flip = self.facing == -1
+        if len(self.walk_frames) > 0:
+            sprite = self.walk_frames.get(self.walk_frame, flip)
         else:
-            sprite = self.image
+            sprite = self.image_flipped if flip else self.image
 
-        if self.facing == -1:
-            sprite = pygame.transform.flip(sprite, True, False)
-
-        surf.blit(sprite, (self.x, self.y))
+        surf.blit(sprite, (x, y))
 
         # ========= DIBUJAR MACHETE =========
-        machete = self.machete_frames[self.machete_frame]
         angle = 0
 
         if self.attacking:
-            swing = math.sin(self.attack_timer * 12) * 25
+            swing = math.sin(self.attack_timer * 12) * MACHETE_SWING_AMPLITUDE
             angle = -swing if self.facing == 1 else swing
+            # Cuantizar al paso de la tabla precalculada
+            angle = round(angle / MACHETE_ANGLE_STEP) * MACHETE_ANGLE_STEP
+
+        machete = self.machete_swing[(self.machete_frame, flip)][angle]
 
         machete_offset_x = 120
         machete_offset_y = 100
 
         if self.facing == 1:
-            mx = self.x + machete_offset_x
-            my = self.y + machete_offset_y
+            mx = x + machete_offset_x
+            my = y + machete_offset_y
         else:
-            machete = pygame.transform.flip(machete, True, False)
-            mx = self.x + (self.w - machete_offset_x - 15)
-            my = self.y + machete_offset_y
-
-        if angle != 0:
-            machete = pygame.transform.rotate(machete, angle)
+            mx = x + (self.w - machete_offset_x - 15)
+            my = y + machete_offset_y
 
         machete_rect = machete.get_rect(center=(mx, my))
         surf.blit(machete, machete_rect)
@@ -1,6 +1,82 @@
 import pygame
 import random
-from config import WIDTH, HEIGHT, draw_text
+from config import WIDTH, HEIGHT, FONT, SMALL, COLOR_TEXT_DEFAULT
+from fonts import get_atlas, render_text
+from assets import load_image
+from spatial import SpatialHash
+from hud import HudField
+
+
+# ==================== TIPOS DE POWER-UP ====================
+POWERUP_TYPES = {
+    "terere": {
+        "label": "TERERÉ",
+        "image": "imagenes/guampa_terere.png",
+        "color": (100, 200, 120),  # Verde (tereré) - fallback
+        "glow_color": (150, 255, 170),
+    },
+    "carrulim": {
+        "label": "CARRULIM",
+        "image": "imagenes/Carrulin.png",
+        "color": (220, 180, 80),  # Dorado (carrulim) - fallback
+        "glow_color": (255, 220, 120),
+    },
+}
+
+
+# ==================== SPRITES COMPARTIDOS ====================
+class PowerUpSprites:
+    """
+    Lo que se dibuja de un tipo de power-up, compartido por todas sus
+    instancias: la imagen, el nombre ya renderizado y el aura.
+
+    El aura solo toma unos pocos tamaños enteros (el brillo oscila entre
+    0 y 40), así que cada tamaño se dibuja una sola vez y después es
+    solo un blit.
+    """
+
+    def __init__(self, tipo, w, h):
+        spec = POWERUP_TYPES[tipo]
+        self.color = spec["color"]
+        self.glow_color = spec["glow_color"]
+        self.glows = {}  # tamaño -> superficie del aura
+
+        # Imagen (None = se dibuja con formas)
+        try:
+            self.image = load_image(spec["image"], (w, h))
+            print(f"✅ Imagen de {spec['label'].lower()} cargada")
+        except Exception as e:
+            print(f"⚠ No se pudo cargar {spec['image']}: {e}")
+            self.image = None
+
+        # Nombre (debajo del ítem), igual que draw_text(..., 10, ...)
+        self.label = render_text(spec["label"], SMALL, COLOR_TEXT_DEFAULT)
+
+    def glow(self, size):
+        """Aura semitransparente de size x size"""
+        glow_surf = self.glows.get(size)
+        if glow_surf is None:
+            glow_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(
+                glow_surf,
+                (*self.glow_color, 60),  # Semi-transparente
+                (size // 2, size // 2),
+                size // 2,
+            )
+            self.glows[size] = glow_surf
+        return glow_surf
+
+
+_SPRITES = {}  # tipo -> PowerUpSprites
+
+
+def get_sprites(tipo, w, h):
+    """Sprites de un tipo, creados la primera vez que aparece"""
+    sprites = _SPRITES.get(tipo)
+    if sprites is None:
+        sprites = PowerUpSprites(tipo, w, h)
+        _SPRITES[tipo] = sprites
+    return sprites
 
 
 # ==================== CLASE POWER-UP ====================
@@ -11,6 +87,22 @@ class PowerUp:
     - Carrulim: Aumenta velocidad y fuerza por 3 segundos
     """
 
+    # Sin __dict__: menos memoria y acceso más rápido a atributos
+    __slots__ = (
+        "x",
+        "y",
+        "w",
+        "h",
+        "tipo",
+        "active",
+        "float_offset",
+        "float_speed",
+        "glow",
+        "glow_dir",
+        "sprites",
+        "hitbox",
+    )
+
     def __init__(self, x, y, tipo):
         """
         Constructor del power-up
@@ -25,6 +117,7 @@ class PowerUp:
         self.h = 50  # Alto (aumentado para las imágenes)
         self.tipo = tipo
         self.active = True  # Si está disponible para recoger
+        self.hitbox = pygame.Rect(x, y, self.w, self.h)  # Se mueve en rect()
 
         # Animación de flotación
         self.float_offset = 0
@@ -34,46 +127,17 @@ class PowerUp:
         self.glow = 0
         self.glow_dir = 1
 
-        # Cargar imagen según el tipo
-        self.image = None
-        self.use_image = False
-
-        if tipo == "terere":
-            self.color = (100, 200, 120)  # Verde (tereré) - fallback
-            self.glow_color = (150, 255, 170)
-            try:
-                self.image = pygame.image.load(
-                    "imagenes/guampa_terere.png"
-                ).convert_alpha()
-                # Escalar la imagen al tamaño deseado
-                self.image = pygame.transform.scale(self.image, (self.w, self.h))
-                self.use_image = True
-                print("✅ Imagen de guampa de tereré cargada")
-            except Exception as e:
-                print(f"⚠ No se pudo cargar guampa_terere.png: {e}")
-                self.use_image = False
-
-        else:  # carrulim
-            self.color = (220, 180, 80)  # Dorado (carrulim) - fallback
-            self.glow_color = (255, 220, 120)
-            try:
-                self.image = pygame.image.load("imagenes/Carrulin.png").convert_alpha()
-                # Escalar la imagen al tamaño deseado
-                self.image = pygame.transform.scale(self.image, (self.w, self.h))
-                self.use_image = True
-                print("✅ Imagen de carrulim cargada")
-            except Exception as e:
-                print(f"⚠ No se pudo cargar carrulim.png: {e}")
-                self.use_image = False
+        # Imagen, nombre y aura compartidos con los demás del mismo tipo
+        self.sprites = get_sprites(tipo, self.w, self.h)
 
     def rect(self):
-        """Devuelve el rectángulo de colisión"""
-        return pygame.Rect(self.x, self.y + self.float_offset, self.w, self.h)
+        """Devuelve el rectángulo de colisión (siempre el mismo Rect)"""
+        self.hitbox.y = int(self.y + self.float_offset)
+        return self.hitbox
 
     def update(self, dt):
         """Actualiza animaciones"""
         # Efecto de flotación
-        self.float_offset = pygame.math.Vector2(0, self.float_offset).y
         self.float_offset += self.float_speed * 15 * dt
         if abs(self.float_offset) > 5:
             self.float_speed *= -1
@@ -88,29 +152,23 @@ class PowerUp:
         if not self.active:
             return
 
+        sprites = self.sprites
         y_pos = self.y + self.float_offset
 
         # Brillo exterior (aura)
         glow_size = int(self.w + self.glow / 2)
-        glow_rect = pygame.Rect(
-            self.x - (glow_size - self.w) // 2,
-            y_pos - (glow_size - self.h) // 2,
-            glow_size,
-            glow_size,
-        )
-        glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-        pygame.draw.circle(
-            glow_surf,
-            (*self.glow_color, 60),  # Semi-transparente
-            (glow_size // 2, glow_size // 2),
-            glow_size // 2,
+        surf.blit(
+            sprites.glow(glow_size),
+            (
+                int(self.x - (glow_size - self.w) // 2),
+                int(y_pos - (glow_size - self.h) // 2),
+            ),
         )
-        surf.blit(glow_surf, glow_rect.topleft)
 
         # Dibujar imagen o fallback
-        if self.use_image and self.image:
+        if sprites.image:
             # Dibujar la imagen PNG
-            surf.blit(self.image, (self.x, y_pos))
+            surf.blit(sprites.image, (self.x, y_pos))
         else:
             # Fallback: dibujar con formas si no hay imagen
             if self.tipo == "terere":
@@ -158,9 +216,10 @@ class PowerUp:
                 )
 
         # Texto del nombre (debajo del ítem)
-        nombre = "TERERÉ" if self.tipo == "terere" else "CARRULIM"
-        draw_text(
-            surf, nombre, 10, self.x + self.w // 2, y_pos + self.h + 8, center=True
+        label = sprites.label
+        surf.blit(
+            label,
+            label.get_rect(center=(self.x + self.w // 2, y_pos + self.h + 8)),
         )
 
 
@@ -172,6 +231,7 @@ class PowerUpManager:
 
     def __init__(self):
         self.powerups = []  # Lista de power-ups activos en el mapa
+        self.grid = SpatialHash()  # Índice para detectar qué se recoge
         self.spawn_timer = 10.0  # Aparece cada 10 segundos
 
         # Efectos activos en el jugador
@@ -179,6 +239,15 @@ class PowerUpManager:
         self.carrulim_timer = 0.0
         self.carrulim_duration = 5.0  # 5 segundos de duración
 
+        # HUD del carrulim: el panel se dibuja una vez y el tiempo restante
+        # se arma con glifos ya rasterizados cuando cambia el décimo
+        self.hud_panel = HudField(lambda _: self.build_hud_panel())
+        self.hud_title = HudField(
+            lambda text: render_text(text, FONT, COLOR_TEXT_DEFAULT)
+        )
+        timer_atlas = get_atlas(SMALL, COLOR_TEXT_DEFAULT)
+        self.hud_timer = HudField(timer_atlas.render)
+
     def update(self, dt, player):
         """
         Actualiza power-ups y efectos
@@ -193,13 +262,16 @@ class PowerUpManager:
             self.spawn_powerup()
             self.spawn_timer = 10.0  # Reinicia a 10 segundos
 
-        # Actualizar cada power-up
-        for powerup in self.powerups[:]:
+        # Actualizar cada power-up y reconstruir el índice de colisiones
+        self.grid.clear()
+        for powerup in self.powerups:
             powerup.update(dt)
+            if powerup.active:
+                self.grid.insert(powerup, powerup.rect())
 
-            # Verificar colisión con el jugador
-            if powerup.active and powerup.rect().colliderect(player.rect()):
-                self.collect_powerup(powerup, player)
+        # Verificar colisión con el jugador (solo los que están cerca)
+        for powerup in self.pickups(player.rect()):
+            self.collect_powerup(powerup, player)
 
         # Actualizar efecto de carrulim
         if self.carrulim_active:
@@ -210,6 +282,10 @@ class PowerUpManager:
         # Limpiar power-ups inactivos (ya recogidos)
         self.powerups = [p for p in self.powerups if p.active]
 
+    def pickups(self, rect):
+        """Power-ups activos que el rect (el del jugador) alcanza a recoger"""
+        return self.grid.query(rect)
+
     def spawn_powerup(self):
         """Genera un nuevo power-up en posición aleatoria"""
         # Elige tipo aleatorio
@@ -279,6 +355,22 @@ class PowerUpManager:
         for powerup in self.powerups:
             powerup.draw(surf)
 
+    def build_hud_panel(self):
+        """Panel, borde, ícono y fondo de la barra: lo que nunca cambia"""
+        panel = pygame.Surface((220, 50), pygame.SRCALPHA)
+        panel.fill((40, 40, 40, 180))  # Semi-transparente
+
+        # Borde brillante
+        pygame.draw.rect(panel, (255, 200, 100), (0, 0, 220, 50), 2)
+
+        # Ícono del carrulim pequeño
+        pygame.draw.rect(panel, (240, 230, 220), (10, 15, 16, 8))
+        pygame.draw.circle(panel, (255, 100, 50), (24, 19), 3)
+
+        # Fondo de la barra de tiempo
+        pygame.draw.rect(panel, (60, 60, 60), (30, 30, 180, 8))
+        return panel
+
     def draw_hud(self, surf, x, y):
         """
         Dibuja el HUD de efectos activos
@@ -288,33 +380,21 @@ class PowerUpManager:
         - x, y: Posición del HUD
         """
         if self.carrulim_active:
-            # Panel semi-transparente
-            panel = pygame.Surface((220, 50), pygame.SRCALPHA)
-            panel.fill((40, 40, 40, 180))
-            surf.blit(panel, (x, y))
-
-            # Borde brillante
-            pygame.draw.rect(surf, (255, 200, 100), (x, y, 220, 50), 2)
-
-            # Ícono del carrulim pequeño
-            icon_x = x + 10
-            icon_y = y + 15
-            pygame.draw.rect(surf, (240, 230, 220), (icon_x, icon_y, 16, 8))
-            pygame.draw.circle(surf, (255, 100, 50), (icon_x + 14, icon_y + 4), 3)
+            surf.blit(self.hud_panel.get(None), (x, y))
 
             # Texto del efecto
-            draw_text(surf, "CARRULIM ACTIVO", 16, x + 35, y + 10)
+            surf.blit(self.hud_title.get("CARRULIM ACTIVO"), (x + 35, y + 10))
 
             # Barra de tiempo restante
             time_pct = self.carrulim_timer / self.carrulim_duration
             bar_width = 180
-            pygame.draw.rect(surf, (60, 60, 60), (x + 30, y + 30, bar_width, 8))
             pygame.draw.rect(
                 surf, (255, 200, 100), (x + 30, y + 30, int(bar_width * time_pct), 8)
             )
 
             # Tiempo restante en texto
-            draw_text(surf, f"{self.carrulim_timer:.1f}s", 14, x + 120, y + 28)
+            timer = self.hud_timer.get(f"{self.carrulim_timer:.1f}s")
+            surf.blit(timer, (x + 120, y + 28))
 
 
 # ==================== INSTRUCCIONES DE USO ====================
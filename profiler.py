@@ -0,0 +1,157 @@
+import pygame
+import time
+from collections import deque
+from config import WIDTH, DEBUG_FONT, PROFILER_HISTORY, COLOR_WHITE
+from fonts import render_text
+
+# Fases del game loop que se miden (en orden)
+PHASES = ("joystick", "events", "update", "draw", "flip")
+
+# Colores de cada fase en el gráfico
+PHASE_COLORS = {
+    "joystick": (120, 120, 255),
+    "events": (120, 220, 255),
+    "update": (255, 200, 80),
+    "draw": (120, 255, 120),
+    "flip": (255, 110, 110),
+}
+
+
+# ==================== PERFILADOR DE FRAMES ====================
+class FrameProfiler:
+    """
+    Mide cuánto tarda cada fase del game loop, separado por pantalla.
+
+    Cada pantalla tiene un buffer circular (deque) por fase con los
+    últimos PROFILER_HISTORY frames. El overlay (F3) muestra el gráfico
+    de tiempo por frame y los percentiles p50/p95/p99 de cada fase de
+    la pantalla activa.
+
+    Uso en el loop:
+        t = PROFILER.begin_frame(screen)
+        ...
+        t = PROFILER.mark("update", t)
+    """
+
+    def __init__(self, history):
+        self.history = history
+        self.samples = {}  # nombre de pantalla -> {fase: deque de ms}
+        self.visible = False
+
+        self.current = None  # Buffers de la pantalla del frame actual
+        self.current_name = None
+        self.frame_ms = 0.0
+
+        # Frames en los que la pantalla quieta no se redibujó (ver main)
+        self.skipped_frames = 0
+
+        # El texto del overlay se recalcula cada tanto (no en cada frame)
+        self.text_timer = 0.0
+        self.text_lines = []
+
+    @staticmethod
+    def now():
+        return time.perf_counter()
+
+    def begin_frame(self, screen):
+        """Empieza un frame de la pantalla dada; devuelve el tiempo actual"""
+        name = screen.screen_name() if screen else "-"
+        buffers = self.samples.get(name)
+        if buffers is None:
+            buffers = {phase: deque(maxlen=self.history) for phase in PHASES}
+            buffers["frame"] = deque(maxlen=self.history)
+            self.samples[name] = buffers
+
+        self.current = buffers
+        self.current_name = name
+        self.frame_ms = 0.0
+        return self.now()
+
+    def mark(self, phase, start):
+        """Registra la fase que empezó en `start`; devuelve el tiempo actual"""
+        end = self.now()
+        ms = (end - start) * 1000.0
+        self.current[phase].append(ms)
+        self.frame_ms += ms
+        return end
+
+    def end_frame(self):
+        """Cierra el frame: guarda el tiempo total de todas las fases"""
+        self.current["frame"].append(self.frame_ms)
+
+    def skip_frame(self):
+        """Cierra un frame en el que no se dibujó nada"""
+        self.skipped_frames += 1
+        self.end_frame()
+
+    def toggle(self):
+        self.visible = not self.visible
+
+    @staticmethod
+    def percentiles(values, points=(50, 95, 99)):
+        """Percentiles (por rango más cercano) de una lista de tiempos"""
+        if not values:
+            return [0.0 for _ in points]
+        ordered = sorted(values)
+        last = len(ordered) - 1
+        return [ordered[round(last * p / 100)] for p in points]
+
+    def stats(self, name=None):
+        """{fase: (p50, p95, p99)} de una pantalla (por defecto la actual)"""
+        buffers = self.samples.get(name or self.current_name, {})
+        return {phase: self.percentiles(values) for phase, values in buffers.items()}
+
+    # ==================== OVERLAY ====================
+    def draw_overlay(self, surf, dt):
+        """Dibuja el gráfico y la tabla de percentiles de la pantalla activa"""
+        if not self.visible or self.current is None:
+            return
+
+        panel_w, panel_h = 330, 250
+        x, y = WIDTH - panel_w - 10, 10
+
+        panel = pygame.Surface((panel_w, panel_h), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        surf.blit(panel, (x, y))
+
+        # ===== GRÁFICO DE TIEMPO POR FRAME =====
+        graph_h = 80
+        graph_y = y + 10 + graph_h
+        scale = graph_h / 33.3  # 33 ms llenan el gráfico
+        frames = self.current["frame"]
+        start = max(0, len(frames) - (panel_w - 20))
+        for i in range(start, len(frames)):
+            h = min(graph_h, frames[i] * scale)
+            color = (255, 90, 90) if frames[i] > 16.7 else (120, 255, 120)
+            gx = x + 10 + i - start
+            pygame.draw.line(surf, color, (gx, graph_y), (gx, graph_y - h))
+
+        # Línea de presupuesto de 60 FPS (16.7 ms)
+        budget_y = graph_y - 16.7 * scale
+        pygame.draw.line(
+            surf, COLOR_WHITE, (x + 10, budget_y), (x + panel_w - 10, budget_y)
+        )
+
+        # ===== TABLA DE PERCENTILES =====
+        self.text_timer -= dt
+        if self.text_timer <= 0:
+            self.text_timer = 0.5
+            stats = self.stats()
+            self.text_lines = [(self.current_name, COLOR_WHITE)]
+            header = f"{'fase':<9}{'p50':>6} {'p95':>6} {'p99':>6} ms"
+            self.text_lines.append((header, COLOR_WHITE))
+            for phase in PHASES + ("frame",):
+                p50, p95, p99 = stats.get(phase, (0.0, 0.0, 0.0))
+                line = f"{phase:<9}{p50:>6.2f} {p95:>6.2f} {p99:>6.2f}"
+                self.text_lines.append((line, PHASE_COLORS.get(phase, COLOR_WHITE)))
+            skipped = f"frames sin dibujar: {self.skipped_frames}"
+            self.text_lines.append((skipped, COLOR_WHITE))
+
+        ty = graph_y + 8
+        for line, color in self.text_lines:
+            surf.blit(render_text(line, DEBUG_FONT, color), (x + 10, ty))
+            ty += 16
+
+
+# Instancia global del perfilador
+PROFILER = FrameProfiler(PROFILER_HISTORY)
@@ -0,0 +1,141 @@
+from config import SPATIAL_CELL_SIZE
+
+# NumPy es opcional: ArrayGrid solo lo usa EnemySwarm, que lo requiere
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# ==================== ÍNDICE ESPACIAL (GRILLA UNIFORME) ====================
+class SpatialHash:
+    """
+    Grilla uniforme para encontrar qué entidades chocan con un rect
+    sin revisar todas (broad-phase).
+
+    Cada entidad se guarda con su rect en todas las celdas que toca; una
+    consulta solo revisa las celdas que toca el rect pedido, así que el
+    costo depende de cuántas entidades hay CERCA y no del total.
+
+    Se reconstruye en cada paso de simulación (clear + insert), después
+    de mover a las entidades.
+    """
+
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}  # (columna, fila) -> lista de (entidad, rect)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.cells.clear()
+        self.count = 0
+
+    def cell_range(self, rect):
+        """Columnas y filas que toca un rect"""
+        size = self.cell_size
+        return (
+            range(rect.left // size, (rect.right - 1) // size + 1),
+            range(rect.top // size, (rect.bottom - 1) // size + 1),
+        )
+
+    def insert(self, item, rect):
+        """Agrega una entidad con el rect que ocupa en este paso"""
+        entry = (item, rect)
+        cols, rows = self.cell_range(rect)
+        for cx in cols:
+            for cy in rows:
+                cell = self.cells.get((cx, cy))
+                if cell is None:
+                    self.cells[(cx, cy)] = [entry]
+                else:
+                    cell.append(entry)
+        self.count += 1
+
+    def query(self, rect):
+        """Entidades cuyo rect choca con el dado (cada una una sola vez)"""
+        found = {}
+        cols, rows = self.cell_range(rect)
+        for cx in cols:
+            for cy in rows:
+                for item, item_rect in self.cells.get((cx, cy), ()):
+                    if id(item) not in found and rect.colliderect(item_rect):
+                        found[id(item)] = item
+        return list(found.values())
+
+
+# ==================== GRILLA PARA ENTIDADES EN ARRAYS (NUMPY) ====================
+class ArrayGrid:
+    """
+    La misma grilla que SpatialHash para entidades guardadas como arrays
+    de NumPy (ver swarm.EnemySwarm), sin un objeto por entidad.
+
+    Cada entidad va en UNA celda, la de su esquina superior izquierda, y
+    los índices se guardan ordenados por celda: las celdas de una fila
+    quedan contiguas y se encuentran con searchsorted. Una consulta
+    agranda el rect pedido hacia arriba y a la izquierda en la caja más
+    grande, así encuentra también a las que empiezan en una celda vecina.
+
+    Se reconstruye (rebuild) después de mover o sacar entidades.
+    """
+
+    # Separa filas en la clave de celda (fila * ROW_STRIDE + columna)
+    ROW_STRIDE = 1 << 20
+
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.rebuild(np.zeros(0), np.zeros(0), np.zeros(0), np.zeros(0))
+
+    def __len__(self):
+        return len(self.order)
+
+    def rebuild(self, left, top, width, height):
+        """
+        Indexa las cajas (arrays de igual largo, ya truncadas a enteros
+        como pygame.Rect). Los índices que devuelve query son posiciones
+        en estos arrays.
+        """
+        self.left = left
+        self.top = top
+        self.right = left + width
+        self.bottom = top + height
+        self.max_w = float(width.max()) if len(width) else 0.0
+        self.max_h = float(height.max()) if len(height) else 0.0
+
+        size = self.cell_size
+        keys = (top // size).astype(np.int64) * self.ROW_STRIDE + (left // size).astype(
+            np.int64
+        )
+        self.order = np.argsort(keys, kind="stable")
+        self.keys = keys[self.order]
+
+    def query(self, rect):
+        """Índices de las cajas que chocan con el rect (cada uno una vez)"""
+        if not len(self.order):
+            return self.order
+
+        # Celdas donde puede estar la esquina de una caja que toca el rect
+        size = self.cell_size
+        col_lo = int((rect.left - self.max_w) // size)
+        col_hi = (rect.right - 1) // size
+        rows = np.arange(
+            int((rect.top - self.max_h) // size), (rect.bottom - 1) // size + 1
+        )
+        starts = np.searchsorted(self.keys, rows * self.ROW_STRIDE + col_lo, "left")
+        ends = np.searchsorted(self.keys, rows * self.ROW_STRIDE + col_hi, "right")
+        if not (ends - starts).any():
+            return self.order[:0]
+        found = np.concatenate(
+            [self.order[a:b] for a, b in zip(starts.tolist(), ends.tolist())]
+        )
+
+        # Fase fina: el mismo criterio que colliderect
+        hits = (
+            (self.left[found] < rect.right)
+            & (self.right[found] > rect.left)
+            & (self.top[found] < rect.bottom)
+            & (self.bottom[found] > rect.top)
+        )
+        return found[hits]
@@ -0,0 +1,150 @@
+"""
+Empaquetado de animaciones en hojas de sprites (paso previo, fuera del juego).
+
+Cada animación (imagenes/*_anim/frameN.png) se escala UNA vez a cada tamaño
+que usan los niveles y el jugador y se guarda como una tira horizontal
+(una hoja por animación y tamaño) en SPRITE_PACK_DIR, junto con un índice
+index.json. Al arrancar, assets.load_frames decodifica solo la hoja y
+recorta los frames como subsuperficies: sin escalar en tiempo de ejecución
+y con una decodificación por animación en vez de una por frame.
+
+Si un frame cambia después de empaquetar, su hoja deja de usarse (se
+cargan los frames sueltos) hasta volver a correr esta herramienta.
+
+Uso:
+    python spritepack.py            # genera/actualiza las hojas
+    python spritepack.py --force    # regenera todas
+    python spritepack.py --clean    # borra el directorio de hojas
+"""
+
+import argparse
+import glob
+import json
+import os
+import shutil
+import sys
+
+import pygame
+from config import SPRITE_PACK_DIR
+from assets import file_stamp, frame_paths, pack_index, pack_key, packed_sheet
+from level import LEVELS_DIR, load_level_spec
+from player import MACHETE_ANIMATION, WALK_ANIMATION
+
+INDEX_VERSION = 1
+
+
+# ==================== QUÉ SE EMPAQUETA ====================
+def animations():
+    """(carpeta, cantidad, tamaño) de cada animación que carga el juego"""
+    found = {}
+    for folder, count, size in (WALK_ANIMATION, MACHETE_ANIMATION):
+        found[pack_key(folder, count, size)] = (folder, count, tuple(size))
+
+    for path in sorted(glob.glob(f"{LEVELS_DIR}/*.json")):
+        spec = load_level_spec(os.path.splitext(os.path.basename(path))[0])
+        for entity in ("enemies", "boss"):
+            frames = spec[entity]["frames"]
+            size = tuple(frames["size"])
+            key = pack_key(frames["folder"], frames["count"], size)
+            found[key] = (frames["folder"], frames["count"], size)
+    return found
+
+
+# ==================== ARMADO DE UNA HOJA ====================
+def build_sheet(folder, count, size, out_dir):
+    """
+    Escala los frames que existen y los pone uno al lado del otro.
+    Devuelve la entrada del índice, o None si la animación no tiene frames.
+    """
+    w, h = size
+    frames = []
+    sources = {}
+    for number, path in enumerate(frame_paths(folder, count), start=1):
+        try:
+            image = pygame.image.load(path)
+        except (pygame.error, FileNotFoundError):
+            continue  # load_frames también omite los que faltan
+        frames.append((number, pygame.transform.scale(image, size)))
+        sources[path] = file_stamp(path)
+
+    if not frames:
+        return None
+
+    sheet = pygame.Surface((w * len(frames), h), pygame.SRCALPHA)
+    for i, (_, image) in enumerate(frames):
+        sheet.blit(image, (i * w, 0))
+
+    name = f"{os.path.basename(folder)}_{w}x{h}.png"
+    pygame.image.save(sheet, os.path.join(out_dir, name))
+    return {
+        "sheet": name,
+        "folder": folder,
+        "count": count,
+        "size": [w, h],
+        "frames": [number for number, _ in frames],
+        "sources": sources,
+    }
+
+
+def build(force=False):
+    """Genera las hojas que faltan o quedaron viejas y reescribe el índice"""
+    os.makedirs(SPRITE_PACK_DIR, exist_ok=True)
+    index = {}
+    built = skipped = decodes = 0
+
+    for key, (folder, count, size) in animations().items():
+        entry = None if force else packed_sheet(folder, count, size)
+        if entry is not None and os.path.exists(
+            os.path.join(SPRITE_PACK_DIR, entry["sheet"])
+        ):
+            index[key] = entry
+            skipped += 1
+            continue
+
+        entry = build_sheet(folder, count, size, SPRITE_PACK_DIR)
+        if entry is None:
+            print(f"⚠ {folder}: sin frames, se omite", file=sys.stderr)
+            continue
+
+        index[key] = entry
+        built += 1
+        decodes += len(entry["frames"])
+        print(
+            f"📦 {entry['sheet']:<28} {len(entry['frames']):2d} frames "
+            f"{size[0]}x{size[1]}",
+            file=sys.stderr,
+        )
+
+    with open(os.path.join(SPRITE_PACK_DIR, "index.json"), "w", encoding="utf-8") as f:
+        json.dump({"version": INDEX_VERSION, "sheets": index}, f, indent=1)
+    pack_index(reload=True)
+
+    print(
+        f"✅ {built} hojas generadas ({decodes} frames), {skipped} ya al día "
+        f"-> {SPRITE_PACK_DIR}",
+        file=sys.stderr,
+    )
+
+
+# ==================== PUNTO DE ENTRADA ====================
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Empaqueta las animaciones en hojas de sprites ya escaladas"
+    )
+    parser.add_argument("--force", action="store_true", help="regenerar todas")
+    parser.add_argument(
+        "--clean", action="store_true", help="borrar las hojas y no generar nada"
+    )
+    args = parser.parse_args(argv)
+
+    if args.clean:
+        shutil.rmtree(SPRITE_PACK_DIR, ignore_errors=True)
+        print(f"🗑 {SPRITE_PACK_DIR} borrado", file=sys.stderr)
+        return 0
+
+    build(force=args.force)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
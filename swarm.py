@@ -0,0 +1,268 @@
+import random
+from config import WIDTH, HEIGHT
+from enemy import Enemy
+from spatial import ArrayGrid, SpatialHash
+
+# NumPy es opcional: sin él se usa EnemyGroup (un Enemy por objeto)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Distancia a la que un enemigo deja de patrullar y persigue al jugador
+CHASE_DISTANCE = 500
+
+
+# ==================== GRUPO DE ENEMIGOS (PYTHON PURO) ====================
+class EnemyGroup:
+    """
+    Enemigos comunes de un nivel, uno por objeto Enemy.
+    Es la versión sin NumPy de EnemySwarm y tiene la misma interfaz:
+
+    - update(dt, player, hurt): mueve, limita, gira y anima a todos;
+      devuelve touching(hurt)
+    - touching(hurt): cuántos enemigos tocan la caja de daño del jugador
+    - hit(rect, damage): golpe del machete; daña a los que chocan con el
+      rect y devuelve cuántos
+    - remove_dead(): saca a los enemigos sin vida
+    - draw_items(alpha): (x, y, frame, mira_derecha, hp) de cada enemigo
+
+    Los choques pasan por un SpatialHash que se reconstruye en cada update
+    (y al sacar muertos), así golpear o tocar cuesta lo mismo con 5 o con
+    500 enemigos.
+    """
+
+    def __init__(self, entity_spec, positions, frame_count):
+        self.spec = entity_spec
+        self.frame_count = frame_count
+        self.enemies = []
+        for x, y in positions:
+            e = Enemy(
+                x,
+                y,
+                name=entity_spec["name"],
+                hp=entity_spec["hp"],
+                speed=entity_spec["speed"],
+                w=entity_spec["w"],
+                h=entity_spec["h"],
+            )
+            e.set_hitbox(*entity_spec["hitbox"])
+            self.enemies.append(e)
+
+        self.grid = SpatialHash()
+        self.rebuild_grid()
+
+    def __len__(self):
+        return len(self.enemies)
+
+    def rebuild_grid(self):
+        self.grid.clear()
+        for e in self.enemies:
+            self.grid.insert(e, e.rect())
+
+    def update(self, dt, player, hurt):
+        min_y = self.spec["min_y"]
+        anim_speed = self.spec["frames"]["speed"]
+        for e in self.enemies:
+            e.update(dt, player)
+
+            # Límite superior del nivel (el inferior ya lo aplica Enemy)
+            if min_y is not None and e.y < min_y:
+                e.y = min_y
+
+            # Girar hacia el jugador
+            e.facing_right = player.x > e.x
+
+            # Animación
+            if self.frame_count:
+                e.anim_timer += dt
+                if e.anim_timer >= anim_speed:
+                    e.anim_timer = 0
+                    e.current_frame = (e.current_frame + 1) % self.frame_count
+
+        self.rebuild_grid()
+        return self.touching(hurt)
+
+    def touching(self, hurt):
+        return len(self.grid.query(hurt))
+
+    def hit(self, rect, damage):
+        targets = self.grid.query(rect)
+        for e in targets:
+            e.take_damage(damage)
+        return len(targets)
+
+    def remove_dead(self):
+        vivos = [e for e in self.enemies if e.hp > 0]
+        if len(vivos) != len(self.enemies):
+            self.enemies = vivos
+            self.rebuild_grid()
+
+    def draw_items(self, alpha):
+        for e in self.enemies:
+            x, y = e.lerp_pos(alpha)
+            yield x, y, e.current_frame, e.facing_right, e.hp
+
+
+# ==================== ENJAMBRE VECTORIZADO (NUMPY) ====================
+class EnemySwarm:
+    """
+    Los mismos enemigos que EnemyGroup pero guardados como "estructura de
+    arrays": posiciones, velocidades, vida, timers y hitboxes son arrays
+    de NumPy y cada update() mueve a todos con unas pocas operaciones.
+
+    Persecución y patrulla siguen exactamente las reglas de Enemy.update:
+    - a menos de CHASE_DISTANCE persigue eje por eje (zona muerta de 2 px)
+      al 90% de su velocidad
+    - lejos patrulla: cuando vence su timer elige dirección -1/0/1 y un
+      nuevo timer de 1 a 3 segundos, y avanza al 50% de su velocidad
+    - se limita a la pantalla y al min_y del nivel
+
+    Las cajas se truncan a enteros igual que pygame.Rect y los choques
+    pasan por un ArrayGrid (la grilla de SpatialHash en arrays) que se
+    reconstruye en cada update y al sacar muertos: dan los mismos
+    resultados que colliderect sin revisar a todos los enemigos.
+    """
+
+    def __init__(self, entity_spec, positions, frame_count):
+        self.spec = entity_spec
+        self.frame_count = frame_count
+        n = len(positions)
+
+        # Los patrones de patrulla dependen de la semilla de `random`
+        self.rng = np.random.default_rng(random.getrandbits(32))
+
+        pos = np.array(positions, dtype=float).reshape(n, 2)
+        self.x = pos[:, 0].copy()
+        self.y = pos[:, 1].copy()
+        self.prev_x = self.x.copy()
+        self.prev_y = self.y.copy()
+
+        self.speed = np.full(n, float(entity_spec["speed"]))
+        self.hp = np.full(n, float(entity_spec["hp"]))
+        self.dir = self.rng.choice([-1.0, 1.0], n)
+        self.timer = np.zeros(n)
+        self.anim_timer = np.zeros(n)
+        self.frame = np.zeros(n, dtype=int)
+        self.facing_right = np.zeros(n, dtype=bool)
+
+        self.w = entity_spec["w"]
+        self.h = entity_spec["h"]
+        off_x, off_y, reduce_w, reduce_h = entity_spec["hitbox"]
+        self.hit_dx = np.full(n, float(off_x))
+        self.hit_dy = np.full(n, float(off_y))
+        self.hit_w = np.full(n, float(max(1, self.w - reduce_w)))
+        self.hit_h = np.full(n, float(max(1, self.h - reduce_h)))
+
+        self.grid = ArrayGrid()
+        self.rebuild_grid()
+
+    def __len__(self):
+        return len(self.x)
+
+    def update(self, dt, player, hurt):
+        n = len(self.x)
+        if n == 0:
+            return 0
+
+        self.prev_x[:] = self.x
+        self.prev_y[:] = self.y
+
+        distx = player.x - self.x
+        disty = player.y - self.y
+        chasing = np.hypot(distx, disty) < CHASE_DISTANCE
+
+        # Persecución
+        # (mismo orden de operaciones que Enemy.update: mismos redondeos)
+        step = self.speed * dt * 0.9 * chasing
+        self.x += step * ((distx > 2).astype(float) - (distx < -2))
+        self.y += step * ((disty > 2).astype(float) - (disty < -2))
+
+        # Patrulla
+        patrol = ~chasing
+        self.timer -= dt * patrol
+        expired = patrol & (self.timer <= 0)
+        count = int(expired.sum())
+        if count:
+            self.dir[expired] = self.rng.integers(-1, 2, count)
+            self.timer[expired] = self.rng.uniform(1.0, 3.0, count)
+        self.x += self.dir * self.speed * dt * 0.5 * patrol
+
+        # Pantalla y límite superior del nivel
+        np.clip(self.x, 0, WIDTH - self.w, out=self.x)
+        np.clip(self.y, 0, HEIGHT - self.h, out=self.y)
+        min_y = self.spec["min_y"]
+        if min_y is not None:
+            np.maximum(self.y, min_y, out=self.y)
+
+        # Girar hacia el jugador
+        np.greater(player.x, self.x, out=self.facing_right)
+
+        # Animación
+        if self.frame_count:
+            self.anim_timer += dt
+            advance = self.anim_timer >= self.spec["frames"]["speed"]
+            self.anim_timer[advance] = 0
+            self.frame[advance] = (self.frame[advance] + 1) % self.frame_count
+
+        self.rebuild_grid()
+        return self.touching(hurt)
+
+    def rebuild_grid(self):
+        """Indexa las hitboxes en sus posiciones actuales"""
+        self.grid.rebuild(
+            np.trunc(self.x + self.hit_dx),
+            np.trunc(self.y + self.hit_dy),
+            self.hit_w,
+            self.hit_h,
+        )
+
+    def touching(self, hurt):
+        return len(self.grid.query(hurt))
+
+    def hit(self, rect, damage):
+        targets = self.grid.query(rect)
+        self.hp[targets] -= damage
+        return len(targets)
+
+    def remove_dead(self):
+        alive = self.hp > 0
+        if alive.all():
+            return
+        for name in (
+            "x",
+            "y",
+            "prev_x",
+            "prev_y",
+            "speed",
+            "hp",
+            "dir",
+            "timer",
+            "anim_timer",
+            "frame",
+            "facing_right",
+            "hit_dx",
+            "hit_dy",
+            "hit_w",
+            "hit_h",
+        ):
+            setattr(self, name, getattr(self, name)[alive])
+        self.rebuild_grid()
+
+    def draw_items(self, alpha):
+        xs = self.prev_x + (self.x - self.prev_x) * alpha
+        ys = self.prev_y + (self.y - self.prev_y) * alpha
+        return zip(
+            xs.tolist(),
+            ys.tolist(),
+            self.frame.tolist(),
+            self.facing_right.tolist(),
+            self.hp.tolist(),
+        )
+
+
+def make_swarm(entity_spec, positions, frame_count):
+    """EnemySwarm si NumPy está instalado, si no EnemyGroup"""
+    if np is None:
+        return EnemyGroup(entity_spec, positions, frame_count)
+    return EnemySwarm(entity_spec, positions, frame_count)
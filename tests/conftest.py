@@ -0,0 +1,8 @@
+import os
+import sys
+
+# Los módulos del juego están en la raíz del repositorio y cargan
+# recursos con rutas relativas a ella
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.chdir(ROOT)
@@ -0,0 +1,35 @@
+import pygame
+from assets import RawImageCache, SurfaceCache
+
+
+def make_image(path, size=(8, 6)):
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    image.fill((10, 120, 200, 255))
+    pygame.image.save(image, str(path))
+
+
+def test_raw_cache_hit_is_writable(tmp_path):
+    """Una superficie "raw" leída del caché en disco admite dibujar encima"""
+    source = tmp_path / "imagen.png"
+    make_image(source)
+    cache_dir = str(tmp_path / "raw")
+
+    # Primer arranque: decodifica y guarda los píxeles en disco
+    SurfaceCache(1 << 20, RawImageCache(cache_dir)).load_image(
+        str(source), (16, 12), mode="raw"
+    )
+
+    # Segundo arranque: la imagen sale del mmap
+    disk = RawImageCache(cache_dir)
+    surface = SurfaceCache(1 << 20, disk).load_image(str(source), (16, 12), mode="raw")
+    assert disk.hits == 1
+
+    surface.fill((255, 0, 0, 255), (0, 0, 4, 4))
+    surface.blit(pygame.Surface((2, 2)), (6, 6))
+    surface.set_at((15, 11), (0, 255, 0, 255))
+    assert surface.get_at((0, 0)) == (255, 0, 0, 255)
+    assert surface.get_at((15, 11)) == (0, 255, 0, 255)
+
+    # El archivo en disco no cambia: otra carga ve los píxeles originales
+    again = RawImageCache(cache_dir).load(str(source), (16, 12))
+    assert again.get_at((0, 0)) == (10, 120, 200, 255)
@@ -0,0 +1,11 @@
+from fonts import get_font, render_text, render_text_alpha
+
+
+def test_render_text_alpha_leaves_cache_untouched():
+    font = get_font("dejavusans", 20)
+    faded = render_text_alpha("Hola", font, (255, 255, 255), 100)
+    assert faded.get_alpha() == 100
+
+    shared = render_text("Hola", font, (255, 255, 255))
+    assert shared is not faded
+    assert shared.get_alpha() in (None, 255)
@@ -0,0 +1,48 @@
+import pygame
+from base import ScreenBase
+from main import ScreenManager
+
+
+class CountingScreen(ScreenBase):
+    def __init__(self):
+        self.draws = 0
+
+    def wants_idle(self):
+        return True
+
+    def draw(self, surf, alpha=1.0):
+        self.draws += 1
+        surf.fill((255, 0, 0))
+
+
+def test_dirty_rects_draw_once_clipped_to_union():
+    surf = pygame.Surface((800, 600))
+    manager = ScreenManager()
+    screen = CountingScreen()
+    manager.push(screen)
+    manager.draw(surf)
+    surf.fill((0, 0, 0))
+
+    screen.draws = 0
+    screen.mark_dirty((10, 10, 20, 20))
+    screen.mark_dirty((100, 100, 20, 20))
+    screen.mark_dirty((50, 10, 5, 5))
+    area = manager.draw(surf)
+
+    assert screen.draws == 1
+    assert area == [pygame.Rect(10, 10, 110, 110)]
+    assert surf.get_at((60, 60)) == (255, 0, 0, 255)
+    assert surf.get_at((200, 200)) == (0, 0, 0, 255)
+
+
+def test_large_union_falls_back_to_full_draw():
+    surf = pygame.Surface((800, 600))
+    manager = ScreenManager()
+    screen = CountingScreen()
+    manager.push(screen)
+    manager.draw(surf)
+
+    # Dos zonas chicas en esquinas opuestas: la unión es casi toda la ventana
+    screen.mark_dirty((0, 0, 10, 10))
+    screen.mark_dirty((780, 580, 10, 10))
+    assert manager.draw(surf) is None
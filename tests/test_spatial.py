@@ -0,0 +1,43 @@
+import random
+
+import pygame
+import pytest
+from spatial import ArrayGrid, SpatialHash
+
+np = pytest.importorskip("numpy")
+
+
+def random_rects(rng, count):
+    return [
+        pygame.Rect(
+            rng.randint(-50, 1300),
+            rng.randint(-50, 800),
+            rng.randint(1, 300),
+            rng.randint(1, 300),
+        )
+        for _ in range(count)
+    ]
+
+
+def test_array_grid_matches_spatial_hash():
+    rng = random.Random(7)
+    boxes = random_rects(rng, 200)
+
+    grid = ArrayGrid()
+    grid.rebuild(
+        np.array([r.x for r in boxes], dtype=float),
+        np.array([r.y for r in boxes], dtype=float),
+        np.array([r.w for r in boxes], dtype=float),
+        np.array([r.h for r in boxes], dtype=float),
+    )
+    hashed = SpatialHash()
+    for i, r in enumerate(boxes):
+        hashed.insert(i, r)
+
+    for query in random_rects(rng, 100):
+        assert sorted(grid.query(query).tolist()) == sorted(hashed.query(query))
+
+
+def test_array_grid_empty():
+    grid = ArrayGrid()
+    assert len(grid.query(pygame.Rect(0, 0, 10, 10))) == 0